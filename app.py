@@ -5,22 +5,29 @@ Making hiring scores ALIVE through interactive visualizations and what-if scenar
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
+import io
 import os
-from dotenv import load_dotenv
-from groq import Groq
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from candidate_data import (
     CANDIDATES,
+    CANDIDATE_NAMES,
+    ALL_CANDIDATES_CONTEXT,
+    PER_CANDIDATE_CONTEXT,
     get_candidate_scores,
-    get_all_candidates_summary,
     GrowthPotentialScorer,
     CareerTrajectoryAnalyzer
 )
 
-# Load environment variables from .env file
-load_dotenv()
+# AI assistant context selectbox options (CANDIDATE_NAMES is built once, when candidate_data is imported)
+_CONTEXT_OPTIONS = ("All Candidates",) + CANDIDATE_NAMES
 
 # Page configuration
 st.set_page_config(
@@ -31,57 +38,95 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: 700;
-        background: linear-gradient(120deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-    }
-    .score-excellent {
-        color: #10b981;
-        font-weight: 700;
-    }
-    .score-good {
-        color: #3b82f6;
-        font-weight: 700;
-    }
-    .score-developing {
-        color: #f59e0b;
-        font-weight: 700;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2rem;
-    }
-    .stTabs [data-baseweb="tab"] {
-        font-size: 1.1rem;
-        font-weight: 600;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css():
+    """Load style.css once per process and wrap it in a <style> tag"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css"), encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 
 # ============================================================================
 # VISUALIZATION FUNCTIONS
 # ============================================================================
 
-def create_radar_chart(sub_scores, candidate_name):
-    """Create a radar chart for sub-factor scores"""
+# Brand palette, also used as the default trace colorway
+CHART_COLORS = ['#667eea', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6']
+
+# Shared Plotly template holding the styling every chart used to repeat inline
+_MARKER_OUTLINE = dict(symbol='circle', line=dict(width=2, color='white'))
+
+
+@st.cache_resource
+def _register_chart_template():
+    """Register the "hiring" Plotly template and make it the default (once per process, not per rerun)"""
+    pio.templates["hiring"] = go.layout.Template(
+        layout=dict(colorway=CHART_COLORS),
+        data=dict(
+            scatter=[go.Scatter(marker=_MARKER_OUTLINE)],
+            scattergl=[go.Scattergl(marker=_MARKER_OUTLINE)],
+            bar=[go.Bar(textposition='outside')]
+        )
+    )
+    pio.templates.default = "plotly+hiring"
+
+
+_register_chart_template()
+
+# Above these sizes scatter charts switch from SVG to WebGL rendering
+WEBGL_POINT_THRESHOLD = 500
+WEBGL_TRACE_THRESHOLD = 5
+
+
+def scatter_trace_type(n_points, n_traces=1):
+    """Pick go.Scattergl for dense charts and go.Scatter otherwise"""
+    if n_points > WEBGL_POINT_THRESHOLD or n_traces > WEBGL_TRACE_THRESHOLD:
+        return go.Scattergl
+    return go.Scatter
+
+
+# Seniority progressions longer than this are downsampled (LTTB) before plotting
+MAX_CHART_POINTS = 1000
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling: indices of the n_out points
+    that best preserve the visual shape of the (x, y) series
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's average
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_radar_chart(sub_scores_items, candidate_name):
+    """Create a radar chart for sub-factor scores (takes a tuple of (factor, score) pairs)"""
+    sub_scores = dict(sub_scores_items)
     categories = [k.replace('_', ' ').title() for k in sub_scores.keys()]
     values = list(sub_scores.values())
 
@@ -112,6 +157,7 @@ def create_radar_chart(sub_scores, candidate_name):
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_timeline_chart(timeline_data):
     """Create an interactive timeline of candidate's career progression"""
     df = pd.DataFrame(timeline_data)
@@ -123,27 +169,33 @@ def create_timeline_chart(timeline_data):
         'achievement': '#f59e0b'
     }
 
-    df['color'] = df['type'].map(color_map)
+    # Every event is plotted (no downsampling: the y axis is categorical, and dropping points
+    # would drop career events); long timelines still switch to WebGL via scatter_trace_type
 
     fig = go.Figure()
 
+    # All events in a single trace, colored per event type
+    Trace = scatter_trace_type(len(df))
+    fig.add_trace(Trace(
+        x=df['year'].to_numpy(),
+        y=df['type'].to_numpy(),
+        mode='markers',
+        marker=dict(size=20, color=df['type'].map(color_map).to_numpy()),
+        customdata=df['event'].to_numpy(),
+        hovertemplate='<b>%{customdata}</b><br>Year: %{x}<extra></extra>',
+        showlegend=False
+    ))
+
+    # Empty traces that only provide the per-type legend entries
     for event_type in df['type'].unique():
-        df_type = df[df['type'] == event_type]
         fig.add_trace(go.Scatter(
-            x=df_type['year'],
-            y=[event_type] * len(df_type),
-            mode='markers+text',
+            x=[None],
+            y=[None],
+            mode='markers',
             name=event_type.title(),
-            marker=dict(
-                size=20,
-                color=color_map[event_type],
-                symbol='circle',
-                line=dict(width=2, color='white')
-            ),
-            text=df_type['event'],
-            textposition="top center",
-            textfont=dict(size=9),
-            hovertemplate='<b>%{text}</b><br>Year: %{x}<extra></extra>'
+            legendgroup=event_type,
+            marker=dict(size=20, color=color_map[event_type]),
+            hoverinfo='skip'
         ))
 
     fig.update_layout(
@@ -157,16 +209,17 @@ def create_timeline_chart(timeline_data):
         height=350,
         hovermode='closest',
         showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        # Legend entries are placeholders (all events share one trace), so they act as a key only
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
+                    itemclick=False, itemdoubleclick=False)
     )
 
     return fig
 
 
-def create_comparison_chart(candidates_data):
-    """Create comparison chart for multiple candidates"""
-    df = pd.DataFrame(candidates_data)
-
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_comparison_chart(df):
+    """Create comparison chart for multiple candidates (expects candidates_df() columns)"""
     fig = go.Figure()
 
     # Create grouped bar chart
@@ -180,7 +233,6 @@ def create_comparison_chart(candidates_data):
             colorbar=dict(title="Score")
         ),
         text=df['score'],
-        textposition='outside',
         texttemplate='<b>%{text:.1f}</b>',
         hovertemplate='<b>%{x}</b><br>Growth Potential: %{y:.1f}/100<extra></extra>'
     ))
@@ -197,21 +249,21 @@ def create_comparison_chart(candidates_data):
     return fig
 
 
-def create_factor_breakdown_chart(sub_scores):
-    """Create horizontal bar chart showing factor contributions"""
-    scorer = GrowthPotentialScorer()
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_factor_breakdown_chart(sub_scores_items):
+    """Create horizontal bar chart showing factor contributions (takes a tuple of (factor, score) pairs)"""
+    sub_scores = dict(sub_scores_items)
 
-    factors = list(sub_scores.keys())
-    scores = list(sub_scores.values())
-    weights = [scorer.WEIGHTS[f] for f in factors]
-    contributions = [s * (w/100) for s, w in zip(scores, weights)]
+    factors = GrowthPotentialScorer.FACTORS
+    scores = np.fromiter((sub_scores[f] for f in factors), dtype=np.float64, count=len(factors))
+    contributions = scores * (GrowthPotentialScorer.WEIGHTS_ARR / 100.0)
 
     labels = [f.replace('_', ' ').title() for f in factors]
 
     df = pd.DataFrame({
         'Factor': labels,
         'Score': scores,
-        'Weight': [f"{w}%" for w in weights],
+        'Weight': [f"{w}%" for w in GrowthPotentialScorer.WEIGHTS.values()],
         'Contribution': contributions
     })
 
@@ -228,7 +280,6 @@ def create_factor_breakdown_chart(sub_scores):
             line=dict(color='white', width=1)
         ),
         text=[f"{s:.0f} (×{w})" for s, w in zip(df['Score'], df['Weight'])],
-        textposition='outside',
         hovertemplate='<b>%{y}</b><br>Score: %{text}<br>Contribution: %{x:.1f}<extra></extra>'
     ))
 
@@ -237,36 +288,40 @@ def create_factor_breakdown_chart(sub_scores):
         xaxis_title="Weighted Contribution to Overall Score",
         yaxis_title="",
         height=350,
-        xaxis=dict(range=[0, max(contributions) * 1.2])
+        xaxis=dict(range=[0, contributions.max() * 1.2])
     )
 
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_seniority_progression_chart(progression, candidate_name):
     """Create line chart showing seniority level progression over time"""
     if not progression:
         return None
 
-    years = [p['year'] for p in progression]
-    levels = [p['level'] for p in progression]
-    events = [p['event'] for p in progression]
+    years = [p.year for p in progression]
+    levels = [p.level for p in progression]
+    events = [p.event for p in progression]
+
+    # Downsample long progressions
+    if len(progression) > MAX_CHART_POINTS:
+        keep = lttb_indices(years, levels, MAX_CHART_POINTS)
+        years = [years[i] for i in keep]
+        levels = [levels[i] for i in keep]
+        events = [events[i] for i in keep]
 
     fig = go.Figure()
 
     # Line chart with markers
-    fig.add_trace(go.Scatter(
+    Trace = scatter_trace_type(len(years))
+    fig.add_trace(Trace(
         x=years,
         y=levels,
         mode='lines+markers',
         name=candidate_name,
         line=dict(color='#667eea', width=3),
-        marker=dict(
-            size=12,
-            color='#667eea',
-            symbol='circle',
-            line=dict(width=2, color='white')
-        ),
+        marker=dict(size=12, color='#667eea'),
         text=events,
         hovertemplate='<b>%{text}</b><br>Year: %{x}<br>Level: %{y}<extra></extra>'
     ))
@@ -295,26 +350,28 @@ def create_seniority_progression_chart(progression, candidate_name):
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_trajectory_comparison_chart(candidates_data):
     """Create comparison chart showing seniority progression for multiple candidates"""
     fig = go.Figure()
 
-    colors = ['#667eea', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6']
+    total_points = sum(len(p) for p in candidates_data.values())
+    Trace = scatter_trace_type(total_points, len(candidates_data))
 
     for idx, (name, progression) in enumerate(candidates_data.items()):
         if not progression:
             continue
 
-        years = [p['year'] for p in progression]
-        levels = [p['level'] for p in progression]
+        years = [p.year for p in progression]
+        levels = [p.level for p in progression]
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(Trace(
             x=years,
             y=levels,
             mode='lines+markers',
             name=name,
-            line=dict(color=colors[idx % len(colors)], width=3),
-            marker=dict(size=10, line=dict(width=2, color='white')),
+            line=dict(color=CHART_COLORS[idx % len(CHART_COLORS)], width=3),
+            marker=dict(size=10),
             hovertemplate=f'<b>{name}</b><br>Year: %{{x}}<br>Level: %{{y}}<extra></extra>'
         ))
 
@@ -343,6 +400,118 @@ def create_trajectory_comparison_chart(candidates_data):
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
+def _build_gauge(sim_overall):
+    """Create the what-if simulator gauge for a (rounded) overall score"""
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=sim_overall,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Overall Score", 'font': {'size': 24}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickwidth': 1},
+            'bar': {'color': "#667eea"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 60], 'color': '#fee2e2'},
+                {'range': [60, 75], 'color': '#dbeafe'},
+                {'range': [75, 100], 'color': '#d1fae5'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+    fig_gauge.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
+    return fig_gauge
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _build_score_gauge(overall_score):
+    """Create the candidate details gauge for an overall score"""
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=overall_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Growth Potential", 'font': {'size': 20}},
+        number={'font': {'size': 60}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'color': "#667eea"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 60], 'color': '#fee2e2'},
+                {'range': [60, 75], 'color': '#dbeafe'},
+                {'range': [75, 100], 'color': '#d1fae5'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 70
+            }
+        }
+    ))
+    fig_gauge.update_layout(height=400, margin=dict(l=10, r=10, t=50, b=10))
+    return fig_gauge
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_score_heatmap(df):
+    """Create the candidates x factors score heatmap (expects the Compare page score table)"""
+    fig_heatmap = go.Figure(data=go.Heatmap(
+        z=df.iloc[:, 1:].values.T,
+        x=df['Candidate'],
+        y=df.columns[1:],
+        colorscale='RdYlGn',
+        text=df.iloc[:, 1:].values.T,
+        texttemplate='%{text:.0f}',
+        textfont={"size": 14},
+        colorbar=dict(title="Score")
+    ))
+
+    fig_heatmap.update_layout(
+        height=500,
+        xaxis_title="Candidate",
+        yaxis_title="Factor"
+    )
+
+    return fig_heatmap
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_factor_comparison_chart(df, selected_factor):
+    """Create bar chart comparing one factor across candidates (expects the Compare page score table)"""
+    fig_factor = go.Figure()
+
+    fig_factor.add_trace(go.Bar(
+        x=df['Candidate'],
+        y=df[selected_factor],
+        marker=dict(
+            color=df[selected_factor],
+            colorscale='Viridis',
+            showscale=True
+        ),
+        text=df[selected_factor],
+        texttemplate='%{text:.1f}'
+    ))
+
+    fig_factor.update_layout(
+        title=f"{selected_factor} Comparison",
+        xaxis_title="Candidate",
+        yaxis_title="Score",
+        yaxis=dict(range=[0, 110]),
+        height=400
+    )
+
+    return fig_factor
+
+
 # ============================================================================
 # INTERACTIVE FEATURES
 # ============================================================================
@@ -350,50 +519,61 @@ def create_trajectory_comparison_chart(candidates_data):
 def what_if_simulator():
     """Interactive what-if scenario simulator"""
     st.subheader("🔮 What-If Scenario Simulator")
-    st.markdown("Adjust the parameters below to see how they affect the Growth Potential score in real-time.")
+    st.markdown("Adjust the parameters below and click **Simulate** to see how they affect the Growth Potential score.")
 
-    col1, col2 = st.columns(2)
+    with st.form("whatif"):
+        col1, col2 = st.columns(2)
 
-    with col1:
-        st.markdown("#### Learning Agility")
-        certifications = st.slider("Certifications Earned", 0, 10, 3, key="cert")
-        courses = st.slider("Courses Completed (12 months)", 0, 20, 8, key="courses")
-        learning_vel = st.slider("Learning Velocity (months between skills)", 1, 12, 4, key="vel",
-                                 help="Lower is better - how many months between acquiring new skills")
-
-        st.markdown("#### Skill Progression")
-        role_trans = st.slider("Role Transitions", 0, 5, 2, key="roles")
-        tech_stack = st.slider("Tech Stack Breadth", 0, 20, 10, key="tech")
-        seniority = st.slider("Years to Current Level", 1, 15, 5, key="sen",
-                             help="Lower is better - faster progression")
+        with col1:
+            st.markdown("#### Learning Agility")
+            certifications = st.slider("Certifications Earned", 0, 10, 3, key="cert")
+            courses = st.slider("Courses Completed (12 months)", 0, 20, 8, key="courses")
+            learning_vel = st.slider("Learning Velocity (months between skills)", 1, 12, 4, key="vel",
+                                     help="Lower is better - how many months between acquiring new skills")
+
+            st.markdown("#### Skill Progression")
+            role_trans = st.slider("Role Transitions", 0, 5, 2, key="roles")
+            tech_stack = st.slider("Tech Stack Breadth", 0, 20, 10, key="tech")
+            seniority = st.slider("Years to Current Level", 1, 15, 5, key="sen",
+                                 help="Lower is better - faster progression")
 
-    with col2:
-        st.markdown("#### Adaptability")
-        industry_sw = st.slider("Industry Switches", 0, 5, 1, key="ind")
-        domain_piv = st.slider("Domain Pivots", 0, 5, 1, key="pivot")
-        challenge = st.slider("Challenge Response (Interview)", 0, 10, 7, key="chal")
-
-        st.markdown("#### Innovation & Feedback")
-        projects = st.slider("Side Projects", 0, 10, 3, key="proj")
-        contributions = st.slider("Team Contributions", 0, 15, 5, key="contrib")
-        patents = st.slider("Patents/Publications", 0, 10, 2, key="pat")
-        improvements = st.slider("Performance Improvements", 0, 10, 3, key="imp")
-        mentorship = st.slider("Mentorship Seeking (0-10)", 0, 10, 6, key="ment")
-        self_aware = st.slider("Self-Awareness (0-10)", 0, 10, 7, key="aware")
-
-    # Calculate scores based on user input
-    scorer = GrowthPotentialScorer()
-
-    sim_scores = {
-        'learning_agility': scorer.calculate_learning_agility(certifications, courses, learning_vel),
-        'skill_progression': scorer.calculate_skill_progression(role_trans, tech_stack, seniority),
-        'adaptability': scorer.calculate_adaptability(industry_sw, domain_piv, challenge),
-        'innovation_mindset': scorer.calculate_innovation_mindset(projects, contributions, patents),
-        'feedback_integration': scorer.calculate_feedback_integration(improvements, mentorship, self_aware)
-    }
+        with col2:
+            st.markdown("#### Adaptability")
+            industry_sw = st.slider("Industry Switches", 0, 5, 1, key="ind")
+            domain_piv = st.slider("Domain Pivots", 0, 5, 1, key="pivot")
+            challenge = st.slider("Challenge Response (Interview)", 0, 10, 7, key="chal")
+
+            st.markdown("#### Innovation & Feedback")
+            projects = st.slider("Side Projects", 0, 10, 3, key="proj")
+            contributions = st.slider("Team Contributions", 0, 15, 5, key="contrib")
+            patents = st.slider("Patents/Publications", 0, 10, 2, key="pat")
+            improvements = st.slider("Performance Improvements", 0, 10, 3, key="imp")
+            mentorship = st.slider("Mentorship Seeking (0-10)", 0, 10, 6, key="ment")
+            self_aware = st.slider("Self-Awareness (0-10)", 0, 10, 7, key="aware")
+
+        st.form_submit_button("Simulate", type="primary", use_container_width=True)
+
+    # Form widgets return their last submitted values, so recompute only when those change
+    inputs = (
+        certifications, courses, learning_vel,
+        role_trans, tech_stack, seniority,
+        industry_sw, domain_piv, challenge,
+        projects, contributions, patents,
+        improvements, mentorship, self_aware
+    )
+    sim_key = hash(inputs)
 
-    sim_overall = scorer.calculate_overall_score(sim_scores)
-    sim_explanation = scorer.get_score_explanation(sim_scores, sim_overall)
+    if st.session_state.get("sim_key") != sim_key:
+        scorer = _scorer()
+
+        sim_scores = scorer.calculate_all(np.array(inputs))
+        sim_overall = scorer.calculate_overall_score(sim_scores)
+        sim_items = tuple(sim_scores.items())
+
+        st.session_state.sim_explanation = _explain(sim_items, sim_overall)
+        st.session_state.sim_fig_gauge = _build_gauge(round(sim_overall, 1))
+        st.session_state.sim_fig_radar = create_radar_chart(sim_items, "Simulated Candidate")
+        st.session_state.sim_key = sim_key
 
     # Display results
     st.markdown("---")
@@ -403,105 +583,149 @@ def what_if_simulator():
 
     with col1:
         # Score gauge
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=sim_overall,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Overall Score", 'font': {'size': 24}},
-            gauge={
-                'axis': {'range': [None, 100], 'tickwidth': 1},
-                'bar': {'color': "#667eea"},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "gray",
-                'steps': [
-                    {'range': [0, 60], 'color': '#fee2e2'},
-                    {'range': [60, 75], 'color': '#dbeafe'},
-                    {'range': [75, 100], 'color': '#d1fae5'}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 70
-                }
-            }
-        ))
-        fig_gauge.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20))
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.plotly_chart(st.session_state.sim_fig_gauge, use_container_width=True)
 
     with col2:
-        st.markdown(sim_explanation)
+        st.markdown(st.session_state.sim_explanation)
 
     # Radar chart
-    st.plotly_chart(create_radar_chart(sim_scores, "Simulated Candidate"), use_container_width=True)
+    st.plotly_chart(st.session_state.sim_fig_radar, use_container_width=True)
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_candidate_context(candidate_name):
-    """Build comprehensive context about a candidate for the AI assistant"""
-    candidate = CANDIDATES[candidate_name]
-    sub_scores, overall_score, explanation = get_candidate_scores(candidate_name)
-
-    context = f"""
-CANDIDATE PROFILE: {candidate_name}
-Role: {candidate['role']}
-Experience: {candidate['experience_years']} years
-Background: {candidate['background']}
-
-GROWTH POTENTIAL SCORE: {overall_score}/100
-
-SUB-FACTOR SCORES:
-"""
-    for factor, score in sub_scores.items():
-        factor_name = factor.replace('_', ' ').title()
-        weight = GrowthPotentialScorer.WEIGHTS[factor]
-        context += f"- {factor_name}: {score:.1f}/100 (Weight: {weight}%)\n"
-
-    context += "\nDETAILED METRICS:\n"
-    for factor_key, metrics in candidate['metrics'].items():
-        factor_name = factor_key.replace('_', ' ').title()
-        context += f"\n{factor_name}:\n"
-        for metric, value in metrics.items():
-            context += f"  - {metric.replace('_', ' ').title()}: {value}\n"
-
-    context += "\nCAREER TIMELINE:\n"
-    for item in sorted(candidate['timeline'], key=lambda x: x['year']):
-        context += f"- {item['year']}: {item['event']} ({item['type']})\n"
+@st.cache_resource
+def _scorer():
+    """Shared GrowthPotentialScorer instance (stateless, safe to reuse)"""
+    return GrowthPotentialScorer()
+
+
+@st.cache_data(show_spinner=False)
+def _explain(scores_tuple, overall):
+    """Cached score explanation keyed on the (factor, score) tuple"""
+    return _scorer().get_score_explanation(dict(scores_tuple), overall)
+
+
+@st.cache_data(show_spinner=False)
+def all_trajectory_metrics():
+    """Trajectory metrics for every candidate in one batch ({name: metrics})"""
+    return {name: CareerTrajectoryAnalyzer.get_trajectory_metrics(name) for name in CANDIDATES}
+
+
+@st.cache_data(show_spinner=False)
+def trajectory_metrics_df():
+    """Trajectory metrics comparison table (one row per candidate)"""
+    trajectory_metrics = all_trajectory_metrics()
+    df = pd.DataFrame.from_records([
+        {
+            'Candidate': name,
+            'Pattern': metrics['pattern'],
+            'Current Level': metrics['current_level'],
+            'Levels Gained': metrics['levels_gained'],
+            'Velocity (levels/year)': metrics['velocity'],
+            'Acceleration': metrics['acceleration']
+        }
+        for name, metrics in trajectory_metrics.items()
+    ])
+
+    # Average promotion time per candidate (0 when there were no promotions)
+    avg_promo_time = np.fromiter(
+        (np.mean([p.years for p in m['promotions']]) if m['promotions'] else 0.0
+         for m in trajectory_metrics.values()),
+        dtype=float,
+        count=len(trajectory_metrics)
+    )
 
-    return context
+    df['Current Level'] = df['Current Level'].map(CareerTrajectoryAnalyzer.SENIORITY_LABELS).fillna("Unknown")
+    df.insert(5, 'Avg Promotion Time (years)',
+              np.where(avg_promo_time > 0, np.char.mod('%.1f', avg_promo_time), "N/A"))
+    df['Acceleration'] = df['Acceleration'].str.title()
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def candidates_df():
+    """Columnar view of CANDIDATES (one row per candidate) with precomputed scores"""
+    rows = []
+    for name, candidate in CANDIDATES.items():
+        sub_scores, overall_score, _ = get_candidate_scores(name, compute_explanation=False)
+        rows.append({
+            'name': name,
+            'role': candidate['role'],
+            'experience_years': candidate['experience_years'],
+            'photo': candidate['photo'],
+            'score': overall_score,
+            **sub_scores
+        })
+    return pd.DataFrame(rows)
+
+
+# Tabular uploads are only parsed up to this many rows
+PREVIEW_ROWS = 50
+# PDF extraction limits, so a huge upload cannot hang the page
+MAX_PAGES = 50
+MAX_CHARS = 200_000
 
 
 def process_uploaded_file(uploaded_file):
     """Process uploaded file and extract text content"""
-    try:
-        file_type = uploaded_file.type
-        file_name = uploaded_file.name
+    return _parse_file(uploaded_file.name, uploaded_file.type, uploaded_file.getvalue())
 
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=24 * 60 * 60)
+def _parse_file(file_name, file_type, data):
+    """Extract text content from raw upload bytes (cached on the content)"""
+    try:
         # Handle different file types
         if file_type == "text/plain" or file_name.endswith('.txt'):
-            content = uploaded_file.read().decode('utf-8')
+            content = data.decode('utf-8')
             return f"FILE: {file_name}\n\n{content}"
 
         elif file_type == "application/json" or file_name.endswith('.json'):
-            import json
-            content = json.loads(uploaded_file.read().decode('utf-8'))
+            content = json.loads(data.decode('utf-8'))
             return f"FILE: {file_name}\n\n{json.dumps(content, indent=2)}"
 
         elif file_type == "text/csv" or file_name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file)
-            return f"FILE: {file_name}\n\nCSV Data Preview (first 50 rows):\n{df.head(50).to_string()}\n\nTotal Rows: {len(df)}\nColumns: {', '.join(df.columns)}"
+            # Read one extra row to know whether the file is longer than the preview
+            df = pd.read_csv(io.BytesIO(data), nrows=PREVIEW_ROWS + 1)
+            n = len(df)
+            total_rows = f"{PREVIEW_ROWS}+" if n > PREVIEW_ROWS else n
+            preview = df.head(PREVIEW_ROWS).to_csv(index=False, sep='\t')
+            return f"FILE: {file_name}\n\nCSV Data Preview (first {PREVIEW_ROWS} rows):\n{preview}\nTotal Rows: {total_rows}\nColumns: {', '.join(df.columns)}"
 
         elif file_name.endswith('.xlsx') or file_name.endswith('.xls'):
-            df = pd.read_excel(uploaded_file)
-            return f"FILE: {file_name}\n\nExcel Data Preview (first 50 rows):\n{df.head(50).to_string()}\n\nTotal Rows: {len(df)}\nColumns: {', '.join(df.columns)}"
+            df = pd.read_excel(io.BytesIO(data), nrows=PREVIEW_ROWS + 1)
+            n = len(df)
+            total_rows = f"{PREVIEW_ROWS}+" if n > PREVIEW_ROWS else n
+            preview = df.head(PREVIEW_ROWS).to_csv(index=False, sep='\t')
+            return f"FILE: {file_name}\n\nExcel Data Preview (first {PREVIEW_ROWS} rows):\n{preview}\nTotal Rows: {total_rows}\nColumns: {', '.join(df.columns)}"
 
         elif file_type == "application/pdf" or file_name.endswith('.pdf'):
-            # For PDF, we'll provide a basic message
-            # You can add PyPDF2 or pdfplumber for actual PDF parsing
-            return f"FILE: {file_name}\n\nPDF file uploaded. Note: Full PDF text extraction requires additional libraries (PyPDF2/pdfplumber)."
+            try:
+                from pypdf import PdfReader
+            except ImportError:
+                return f"FILE: {file_name}\n\nPDF file uploaded. Note: Full PDF text extraction requires the optional pypdf library."
+
+            reader = PdfReader(io.BytesIO(data))
+            n_pages = len(reader.pages)
+
+            # Extract page by page, stopping at the page or character limit
+            pages = []
+            n_chars = 0
+            for page in reader.pages[:MAX_PAGES]:
+                text = page.extract_text() or ""
+                pages.append(text)
+                n_chars += len(text)
+                if n_chars >= MAX_CHARS:
+                    break
+
+            content = "\n\n".join(pages)[:MAX_CHARS]
+            if len(pages) < n_pages or n_chars > MAX_CHARS:
+                st.warning(f"⚠️ Large PDF: only the first {len(pages)} of {n_pages} pages "
+                           f"(up to {MAX_CHARS:,} characters) were extracted.")
+            return f"FILE: {file_name}\n\nPDF Text ({n_pages} pages):\n{content}"
 
         else:
             return f"FILE: {file_name}\n\nUnsupported file type: {file_type}"
@@ -514,11 +738,286 @@ def process_uploaded_file(uploaded_file):
 # AI ASSISTANT & RESUME MATCHER
 # ============================================================================
 
+# Prompt budgets, measured with a ~4 characters per token heuristic
+MAX_CONTEXT_TOKENS = 4000
+MAX_UPLOAD_TOKENS = 6000
+
+
+def estimate_tokens(text):
+    """Cheap token estimate (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+def trim_history(messages, max_tokens=MAX_CONTEXT_TOKENS):
+    """Newest messages that fit in the token budget, in chronological order (the latest is always kept)"""
+    kept = []
+    used = 0
+    for msg in reversed(messages):
+        cost = estimate_tokens(msg["content"])
+        if kept and used + cost > max_tokens:
+            break
+        kept.append(msg)
+        used += cost
+    kept.reverse()
+    return kept
+
+
+CHAT_ROLE_LABELS = {"user": "🧑 **You**", "assistant": "🤖 **Assistant**"}
+
+
+def render_chat_history(messages):
+    """
+    Render a conversation with few elements: everything but the latest message goes
+    into one markdown block, and only the latest message gets its own chat bubble
+    """
+    if not messages:
+        return
+    if len(messages) > 1:
+        with st.container(border=True):
+            st.markdown("\n\n---\n\n".join(
+                f"{CHAT_ROLE_LABELS.get(m['role'], m['role'])}\n\n{m['content']}" for m in messages[:-1]
+            ))
+    with st.chat_message(messages[-1]["role"]):
+        st.markdown(messages[-1]["content"])
+
+
+def truncate_to_tokens(text, max_tokens):
+    """Cut text down to roughly max_tokens, marking the cut"""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "\n\n[... document truncated to fit the prompt ...]"
+
+
+@st.cache_resource(show_spinner=False)
+def _load_env_once():
+    """Load environment variables from the .env file (first AI Assistant visit only)"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@st.cache_resource(show_spinner=False)
+def groq_client(api_key):
+    """Shared Groq client so its HTTP connection pool survives reruns"""
+    from groq import Groq
+    return Groq(api_key=api_key)
+
+
+# Seconds between reruns while a background completion is still running
+POLL_INTERVAL = 0.5
+
+
+@st.cache_resource(show_spinner=False)
+def llm_executor():
+    """Shared worker pool for long Groq calls, so they don't block the script thread"""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def complete_llm(client, model, messages_tuple, temperature, max_tokens):
+    """
+    Plain (non-streaming) chat completion for the canonical ((role, content), ...) message tuple
+    Uses no Streamlit APIs, so it is safe to run on an llm_executor() worker thread
+    """
+    response = client.chat.completions.create(
+        model=model,
+        messages=[{"role": role, "content": content} for role, content in messages_tuple],
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content
+
+
+# Small, fast model and budget for the resume/JD context cards used by follow-up questions
+CARD_MODEL = "llama-3.1-8b-instant"
+CARD_MAX_TOKENS = 500
+
+
+def context_card_messages(kind, text):
+    """Messages asking for a compact context card summarizing a resume or job description"""
+    return (
+        ("system", "You are an expert technical recruiter. Summarize documents into dense, factual context cards."),
+        ("user", f"""Summarize this {kind} into a context card of at most {CARD_MAX_TOKENS} tokens.
+Keep every concrete detail a recruiter would need to answer questions later: roles, employers, dates, skills, tools, metrics, requirements, education and certifications. Use terse bullet points.
+
+{kind.upper()}:
+{text}""")
+    )
+
+
+# Chat questions go to a small, fast model first and escalate to the requested model when needed
+ROUTER_MODEL = "llama-3.1-8b-instant"
+ESCALATE_SENTINEL = "ESCALATE"
+ROUTER_INSTRUCTION = (
+    "\n\nIf answering needs detailed multi-step reasoning or facts you are not sure of, "
+    f"reply with exactly {ESCALATE_SENTINEL} and nothing else."
+)
+
+
+# Finished chat answers are reused for an hour, across sessions, for up to this many conversations
+CHAT_CACHE_TTL = 3600
+CHAT_CACHE_MAX_ENTRIES = 256
+
+
+@st.cache_resource(show_spinner=False)
+def chat_answer_cache():
+    """Process-wide LRU of final chat answers, (timestamp, text) per key, with the lock guarding it"""
+    return OrderedDict(), threading.Lock()
+
+
+def _groq_complete(client, model, messages_tuple, temperature, max_tokens):
+    """
+    Stream a chat answer, reusing the final text for a repeated (model, trimmed conversation, sampling params)
+    - model: model used when the router escalates
+    - messages_tuple: (role, content) pairs sent to the API; the whole conversation is part of
+      the cache key, so a follow-up only replays when its history matches too
+    Only the finished string is cached: a hit renders it once with st.markdown instead of calling the API
+    """
+    cache, lock = chat_answer_cache()
+    key = (model, messages_tuple, temperature, max_tokens)
+    with lock:
+        entry = cache.get(key)
+        if entry is not None and time.time() - entry[0] <= CHAT_CACHE_TTL:
+            cache.move_to_end(key)
+            answer = entry[1]
+        else:
+            answer = None
+
+    if answer is not None:
+        st.markdown(answer)
+        return answer
+
+    answer = st.write_stream(stream_routed(client, model, messages_tuple, temperature, max_tokens))
+    with lock:
+        cache[key] = (time.time(), answer)
+        cache.move_to_end(key)
+        while len(cache) > CHAT_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    return answer
+
+
+class DiskCacher:
+    """
+    Best-effort JSON cache on disk, one file per SHA-256 key
+    - max_age: seconds before an entry expires (checked against the file mtime on get)
+    - max_entries: oldest entries are removed on set once the directory holds more than this
+    """
+
+    def __init__(self, directory, max_age, max_entries):
+        self.directory = directory
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(*parts):
+        """SHA-256 over length-prefixed str/bytes parts"""
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part if isinstance(part, bytes) else part.encode('utf-8')
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Cached value, or None when missing, expired or unreadable (expired entries are removed)"""
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, value):
+        """Store a JSON-serializable value (write errors only cost a future cache miss)"""
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(path + ".tmp", path)
+            self._prune()
+        except OSError:
+            pass
+
+    def _prune(self):
+        """Remove the oldest entries beyond max_entries"""
+        with os.scandir(self.directory) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(".json")]
+        files.sort()
+        for _, path in files[:max(len(files) - self.max_entries, 0)]:
+            os.remove(path)
+
+
+# Match analyses persist across sessions and restarts, keyed on (model, resume bytes, job description).
+# They hold candidate personal data, so entries expire after a week and the directory is bounded
+MATCH_MODEL = "llama-3.3-70b-versatile"
+MATCH_CACHE_MAX_AGE = 7 * 24 * 3600
+MATCH_CACHE_MAX_ENTRIES = 200
+MATCH_CACHE = DiskCacher(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "match"),
+    max_age=MATCH_CACHE_MAX_AGE,
+    max_entries=MATCH_CACHE_MAX_ENTRIES
+)
+
+
+def store_match_result(pending, analysis, resume_card, jd_card):
+    """
+    Store a finished match analysis in session state for display and follow-up questions
+    Follow-ups send the cards instead of the full documents; a missing card falls back
+    to the (budgeted) document
+    """
+    st.session_state.match_analysis = analysis
+    st.session_state.match_resume_filename = pending['resume_filename']
+    st.session_state.match_resume_card = resume_card or truncate_to_tokens(pending['resume_content'], MAX_UPLOAD_TOKENS)
+    st.session_state.match_jd_card = jd_card or truncate_to_tokens(pending['jd_content'], MAX_UPLOAD_TOKENS)
+
+
+def stream_routed(client, model, messages_tuple, temperature, max_tokens):
+    """
+    Stream an answer from ROUTER_MODEL, switching to a streamed answer from `model` if the
+    small model's reply starts with ESCALATE_SENTINEL (expects a leading system message)
+    """
+    (system_role, system_msg), *history = messages_tuple
+    router_messages = ((system_role, system_msg + ROUTER_INSTRUCTION), *history)
+    chunks = stream_llm(client, ROUTER_MODEL, router_messages, temperature, max_tokens)
+
+    # Hold back the leading text only until it can no longer turn out to be the sentinel
+    head = ""
+    for text in chunks:
+        head += text
+        lead = head.lstrip()
+        if len(lead) >= len(ESCALATE_SENTINEL) or not ESCALATE_SENTINEL.startswith(lead):
+            break
+
+    if head.lstrip().startswith(ESCALATE_SENTINEL):
+        chunks.close()
+        yield from stream_llm(client, model, messages_tuple, temperature, max_tokens)
+        return
+    yield head
+    yield from chunks
+
+
+def stream_llm(client, model, messages_tuple, temperature, max_tokens):
+    """Yield chat completion text as it is generated (for st.write_stream)"""
+    response = client.chat.completions.create(
+        model=model,
+        messages=[{"role": role, "content": content} for role, content in messages_tuple],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    for chunk in response:
+        yield chunk.choices[0].delta.content or ""
+
+
 def gpt_assistant():
     """AI-powered chat assistant to explain candidate scores"""
     st.subheader("🤖 AI Assistant")
 
-    # Try to load API key from environment variable first
+    # Try to load API key from environment variable (or .env file) first
+    _load_env_once()
     api_key = os.getenv("GROQ_API_KEY")
 
     # If not in environment, show input field
@@ -546,7 +1045,7 @@ def gpt_assistant():
 
     # Initialize Groq client
     try:
-        client = Groq(api_key=api_key)
+        client = groq_client(api_key)
     except Exception as e:
         st.error(f"Error initializing Groq client: {str(e)}")
         return
@@ -569,16 +1068,18 @@ def gpt_assistant():
         if "uploaded_file_content" not in st.session_state:
             st.session_state.uploaded_file_content = None
 
-        # Process uploaded file
-        if uploaded_file is not None:
+        # Process uploaded file (only when a different file lands in the uploader)
+        if uploaded_file is not None and st.session_state.get("last_file_id") != uploaded_file.file_id:
             with st.spinner("Processing uploaded file..."):
-                file_content = process_uploaded_file(uploaded_file)
-                st.session_state.uploaded_file_content = file_content
+                st.session_state.uploaded_file_content = process_uploaded_file(uploaded_file)
+                st.session_state.last_file_id = uploaded_file.file_id
                 st.success(f"✅ File '{uploaded_file.name}' processed successfully!")
 
-                # Show preview in expander
-                with st.expander("📄 View uploaded file preview"):
-                    st.text(file_content[:1000] + ("..." if len(file_content) > 1000 else ""))
+        # Show preview in expander
+        if uploaded_file is not None and st.session_state.uploaded_file_content is not None:
+            file_content = st.session_state.uploaded_file_content
+            with st.expander("📄 View uploaded file preview"):
+                st.text(file_content[:1000] + ("..." if len(file_content) > 1000 else ""))
 
         # Option to clear uploaded file
         if st.session_state.uploaded_file_content is not None:
@@ -591,30 +1092,19 @@ def gpt_assistant():
         # Candidate selector (in Chat Assistant tab)
         candidate_name = st.selectbox(
             "Select a candidate to discuss (or ask general questions)",
-            ["All Candidates"] + list(CANDIDATES.keys())
+            _CONTEXT_OPTIONS,
+            key="context_select"
         )
 
         # Build context
-        if candidate_name == "All Candidates":
-            context = "OVERVIEW OF ALL CANDIDATES:\n\n"
-            for name in CANDIDATES.keys():
-                sub_scores, overall_score, _ = get_candidate_scores(name)
-                context += f"\n{name}:\n"
-                context += f"- Overall Score: {overall_score}/100\n"
-                context += f"- Role: {CANDIDATES[name]['role']}\n"
-                for factor, score in sub_scores.items():
-                    context += f"- {factor.replace('_', ' ').title()}: {score:.1f}/100\n"
-        else:
-            context = get_candidate_context(candidate_name)
+        context = PER_CANDIDATE_CONTEXT.get(candidate_name, ALL_CANDIDATES_CONTEXT)
 
         # Initialize chat history
         if "messages" not in st.session_state:
             st.session_state.messages = []
 
         # Display chat history
-        for message in st.session_state.messages:
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
+        render_chat_history(st.session_state.messages)
 
         # Chat input
         if prompt := st.chat_input("Ask me anything about the candidates..."):
@@ -646,25 +1136,24 @@ Be conversational but professional. If asked to compare, provide balanced analys
 
                         # Add uploaded file content to system message if available
                         if st.session_state.uploaded_file_content:
-                            system_message += f"\n\nADDITIONAL UPLOADED DOCUMENT:\n{st.session_state.uploaded_file_content}"
+                            uploaded = truncate_to_tokens(st.session_state.uploaded_file_content, MAX_UPLOAD_TOKENS)
+                            system_message += f"\n\nADDITIONAL UPLOADED DOCUMENT:\n{uploaded}"
 
                         messages = [{"role": "system", "content": system_message}]
 
-                        # Add conversation history (last 5 messages)
-                        for msg in st.session_state.messages[-5:]:
+                        # Add as much recent conversation history as fits the token budget
+                        for msg in trim_history(st.session_state.messages):
                             messages.append({"role": msg["role"], "content": msg["content"]})
 
-                        # Call Groq API
-                        response = client.chat.completions.create(
-                            model="llama-3.3-70b-versatile",
-                            messages=messages,
+                        # Call Groq API, rendering tokens as they arrive (repeat questions hit the cache)
+                        assistant_message = _groq_complete(
+                            client,
+                            "llama-3.3-70b-versatile",
+                            tuple((m["role"], m["content"]) for m in messages),
                             temperature=0.7,
                             max_tokens=1000
                         )
 
-                        assistant_message = response.choices[0].message.content
-                        st.markdown(assistant_message)
-
                         # Save assistant response
                         st.session_state.messages.append({"role": "assistant", "content": assistant_message})
 
@@ -679,50 +1168,65 @@ Be conversational but professional. If asked to compare, provide balanced analys
     with mode_tab2:
         st.markdown("Upload a resume and paste a job description to get an AI-powered match analysis with scoring!")
 
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("#### 📄 Resume")
-            resume_file = st.file_uploader(
-                "Upload Resume",
-                type=['txt', 'pdf', 'doc', 'docx'],
-                help="Upload the candidate's resume",
-                key="resume_upload"
-            )
+        # Inputs live in a form, so editing them doesn't rerun the page until submitted
+        with st.form("matcher_form"):
+            col1, col2 = st.columns(2)
 
-            if resume_file:
-                resume_content = process_uploaded_file(resume_file)
-                with st.expander("👀 View resume preview"):
-                    st.text(resume_content[:500] + ("..." if len(resume_content) > 500 else ""))
+            with col1:
+                st.markdown("#### 📄 Resume")
+                resume_file = st.file_uploader(
+                    "Upload Resume",
+                    type=['txt', 'pdf', 'doc', 'docx'],
+                    help="Upload the candidate's resume",
+                    key="resume_upload"
+                )
 
-        with col2:
-            st.markdown("#### 📋 Job Description")
-            job_description = st.text_area(
-                "Paste Job Description",
-                height=200,
-                placeholder="Paste the full job description here...",
-                key="jd_input"
-            )
+            with col2:
+                st.markdown("#### 📋 Job Description")
+                job_description = st.text_area(
+                    "Paste Job Description",
+                    height=200,
+                    placeholder="Paste the full job description here...",
+                    key="jd_input"
+                )
+
+            # Match button
+            submitted = st.form_submit_button("🎯 Analyze Match", type="primary", use_container_width=True)
+
+        if resume_file:
+            resume_content = process_uploaded_file(resume_file)
+            with st.expander("👀 View resume preview"):
+                st.text(resume_content[:500] + ("..." if len(resume_content) > 500 else ""))
+
+        if submitted:
+            match_key = MATCH_CACHE.key(MATCH_MODEL, resume_file.getvalue(), job_description) \
+                if resume_file and job_description else None
+            pending = {
+                'resume_content': resume_content if resume_file else None,
+                'jd_content': job_description,
+                'resume_filename': resume_file.name if resume_file else None,
+                'key': match_key
+            }
 
-        # Match button
-        if st.button("🎯 Analyze Match", type="primary", use_container_width=True):
             if not resume_file:
                 st.error("Please upload a resume first!")
             elif not job_description:
                 st.error("Please paste a job description!")
+            elif (cached_match := MATCH_CACHE.get(match_key)) is not None:
+                # This resume and job description were analyzed before
+                store_match_result(pending, cached_match['analysis'], cached_match['resume_card'], cached_match['jd_card'])
             else:
-                with st.spinner("Analyzing resume-job match..."):
-                    try:
-                        resume_content = process_uploaded_file(resume_file)
-
-                        # Build matching prompt
-                        matching_prompt = f"""You are an expert technical recruiter and hiring analyst. Analyze the match between this resume and job description.
+                # Build matching prompt (resume_content was parsed for the preview above);
+                # both documents are held to the upload token budget, like chat uploads
+                resume_text = truncate_to_tokens(resume_content, MAX_UPLOAD_TOKENS)
+                jd_text = truncate_to_tokens(job_description, MAX_UPLOAD_TOKENS)
+                matching_prompt = f"""You are an expert technical recruiter and hiring analyst. Analyze the match between this resume and job description.
 
 RESUME:
-{resume_content}
+{resume_text}
 
 JOB DESCRIPTION:
-{job_description}
+{jd_text}
 
 Please provide a comprehensive match analysis with the following structure:
 
@@ -753,28 +1257,57 @@ Please provide a comprehensive match analysis with the following structure:
 
 Be specific, use bullet points, and reference concrete examples from both documents."""
 
-                        messages = [
-                            {"role": "system", "content": "You are an expert technical recruiter and hiring analyst."},
-                            {"role": "user", "content": matching_prompt}
-                        ]
-
-                        response = client.chat.completions.create(
-                            model="llama-3.3-70b-versatile",
-                            messages=messages,
-                            temperature=0.5,
-                            max_tokens=2000
-                        )
-
-                        match_analysis = response.choices[0].message.content
-
-                        # Store in session state for follow-up questions
-                        st.session_state.match_analysis = match_analysis
-                        st.session_state.match_resume_content = resume_content
-                        st.session_state.match_jd_content = job_description
-                        st.session_state.match_resume_filename = resume_file.name
-
-                    except Exception as e:
-                        st.error(f"Error analyzing match: {str(e)}")
+                messages = [
+                    {"role": "system", "content": "You are an expert technical recruiter and hiring analyst."},
+                    {"role": "user", "content": matching_prompt}
+                ]
+
+                # Run the analysis and the follow-up context cards on worker threads;
+                # the rerun loop below picks up the results
+                executor = llm_executor()
+                st.session_state.match_future = executor.submit(
+                    complete_llm,
+                    client,
+                    MATCH_MODEL,
+                    tuple((m["role"], m["content"]) for m in messages),
+                    0.5,
+                    2000
+                )
+                st.session_state.match_card_futures = {
+                    'resume': executor.submit(
+                        complete_llm, client, CARD_MODEL,
+                        context_card_messages("resume", resume_text), 0.2, CARD_MAX_TOKENS
+                    ),
+                    'jd': executor.submit(
+                        complete_llm, client, CARD_MODEL,
+                        context_card_messages("job description", jd_text), 0.2, CARD_MAX_TOKENS
+                    )
+                }
+                st.session_state.match_pending = pending
+
+        # Collect the background match analysis, polling with reruns until it finishes
+        match_future = st.session_state.get("match_future")
+        if match_future is not None:
+            card_futures = st.session_state.match_card_futures
+            if match_future.done() and all(f.done() for f in card_futures.values()):
+                st.session_state.match_future = None
+                st.session_state.match_card_futures = None
+                pending = st.session_state.pop("match_pending")
+                try:
+                    analysis = match_future.result()
+                    cards = {kind: f.result() if f.exception() is None else None for kind, f in card_futures.items()}
+                    store_match_result(pending, analysis, cards['resume'], cards['jd'])
+                    MATCH_CACHE.set(pending['key'], {
+                        'analysis': analysis,
+                        'resume_card': cards['resume'],
+                        'jd_card': cards['jd']
+                    })
+                except Exception as e:
+                    st.error(f"Error analyzing match: {str(e)}")
+            else:
+                st.info("⏳ Analyzing resume-job match... (you can keep using the other tabs)")
+                time.sleep(POLL_INTERVAL)
+                st.rerun()
 
         # Display match analysis if it exists
         if "match_analysis" in st.session_state and st.session_state.match_analysis:
@@ -801,9 +1334,7 @@ Be specific, use bullet points, and reference concrete examples from both docume
                 st.session_state.matcher_chat_messages = []
 
             # Display matcher chat history
-            for message in st.session_state.matcher_chat_messages:
-                with st.chat_message(message["role"]):
-                    st.markdown(message["content"])
+            render_chat_history(st.session_state.matcher_chat_messages)
 
             # Chat input for follow-up questions
             if followup_prompt := st.chat_input("Ask a follow-up question about this match...", key="matcher_chat_input"):
@@ -819,11 +1350,11 @@ Be specific, use bullet points, and reference concrete examples from both docume
                             # Build context-aware system message
                             followup_system_message = f"""You are an expert technical recruiter and hiring analyst. You previously analyzed a resume-job description match.
 
-RESUME:
-{st.session_state.match_resume_content}
+RESUME (context card):
+{st.session_state.match_resume_card}
 
-JOB DESCRIPTION:
-{st.session_state.match_jd_content}
+JOB DESCRIPTION (context card):
+{st.session_state.match_jd_card}
 
 PREVIOUS MATCH ANALYSIS:
 {st.session_state.match_analysis}
@@ -832,21 +1363,19 @@ The user has follow-up questions about this match analysis. Answer their questio
 
                             followup_messages = [{"role": "system", "content": followup_system_message}]
 
-                            # Add conversation history (last 10 messages for context)
-                            for msg in st.session_state.matcher_chat_messages[-10:]:
+                            # Add as much recent conversation history as fits the token budget
+                            for msg in trim_history(st.session_state.matcher_chat_messages):
                                 followup_messages.append({"role": msg["role"], "content": msg["content"]})
 
-                            # Call Groq API
-                            followup_response = client.chat.completions.create(
-                                model="llama-3.3-70b-versatile",
-                                messages=followup_messages,
+                            # Call Groq API, rendering tokens as they arrive (repeat questions hit the cache)
+                            assistant_message = _groq_complete(
+                                client,
+                                "llama-3.3-70b-versatile",
+                                tuple((m["role"], m["content"]) for m in followup_messages),
                                 temperature=0.6,
                                 max_tokens=1500
                             )
 
-                            assistant_message = followup_response.choices[0].message.content
-                            st.markdown(assistant_message)
-
                             # Save assistant response
                             st.session_state.matcher_chat_messages.append({"role": "assistant", "content": assistant_message})
 
@@ -862,9 +1391,9 @@ The user has follow-up questions about this match analysis. Answer their questio
             with col2:
                 if st.button("🔄 New Analysis", key="reset_matcher"):
                     st.session_state.match_analysis = None
-                    st.session_state.match_resume_content = None
-                    st.session_state.match_jd_content = None
                     st.session_state.match_resume_filename = None
+                    st.session_state.match_resume_card = None
+                    st.session_state.match_jd_card = None
                     st.session_state.matcher_chat_messages = []
                     st.rerun()
 
@@ -877,6 +1406,31 @@ The user has follow-up questions about this match analysis. Answer their questio
 # MAIN APPLICATION
 # ============================================================================
 
+# Static sidebar and card markup. Streamlit re-executes app.py on every rerun, so these are
+# rebuilt each time too; they are only constants that keep the markup out of main()
+SIDEBAR_ABOUT_MD = """
+    Growth Potential measures a candidate's ability to:
+    - **Learn & Adapt** quickly
+    - **Progress** in their career
+    - **Innovate** and contribute
+    - **Integrate feedback** effectively
+    """
+SIDEBAR_WEIGHTS_MD = "\n\n".join(
+    f"**{factor.replace('_', ' ').title()}:** {weight}%"
+    for factor, weight in GrowthPotentialScorer.WEIGHTS.items()
+)
+CARD_HTML_TEMPLATE = """
+            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                        padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
+                <div style='font-size: 3rem;'>{photo}</div>
+                <h3>{name}</h3>
+                <p>{role}</p>
+                <h1 style='font-size: 3rem; margin: 1rem 0;'>{score}</h1>
+                <p style='font-size: 0.9rem;'>Growth Potential Score</p>
+            </div>
+            """
+
+
 def main():
     """Main application entry point with navigation and routing"""
 
@@ -895,19 +1449,11 @@ def main():
 
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📊 About Growth Potential")
-    st.sidebar.markdown("""
-    Growth Potential measures a candidate's ability to:
-    - **Learn & Adapt** quickly
-    - **Progress** in their career
-    - **Innovate** and contribute
-    - **Integrate feedback** effectively
-    """)
+    st.sidebar.markdown(SIDEBAR_ABOUT_MD)
 
     st.sidebar.markdown("---")
     st.sidebar.markdown("### ⚖️ Factor Weights")
-    weights = GrowthPotentialScorer.WEIGHTS
-    for factor, weight in weights.items():
-        st.sidebar.markdown(f"**{factor.replace('_', ' ').title()}:** {weight}%")
+    st.sidebar.markdown(SIDEBAR_WEIGHTS_MD)
 
     # Page routing
     if page == "🏠 Dashboard":
@@ -930,26 +1476,14 @@ def show_dashboard():
     """Show overview dashboard"""
     st.header("Candidate Rankings")
 
-    # Get all candidates
-    summary = get_all_candidates_summary()
+    # Get all candidates, ranked by score
+    summary = candidates_df().sort_values('score', ascending=False, kind='stable', ignore_index=True)
 
     # Display ranking cards
     cols = st.columns(3)
-    for idx, candidate in enumerate(summary):
+    for idx, candidate in enumerate(summary.to_dict('records')):
         with cols[idx]:
-            score_class = "score-excellent" if candidate['score'] >= 75 else \
-                         "score-good" if candidate['score'] >= 60 else "score-developing"
-
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
-                <div style='font-size: 3rem;'>{candidate['photo']}</div>
-                <h3>{candidate['name']}</h3>
-                <p>{candidate['role']}</p>
-                <h1 style='font-size: 3rem; margin: 1rem 0;'>{candidate['score']}</h1>
-                <p style='font-size: 0.9rem;'>Growth Potential Score</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CARD_HTML_TEMPLATE.format(**candidate), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -960,8 +1494,8 @@ def show_dashboard():
     st.subheader("💡 Quick Insights")
     col1, col2, col3 = st.columns(3)
 
-    top_candidate = summary[0]
-    avg_score = np.mean([c['score'] for c in summary])
+    top_candidate = summary.iloc[0]
+    avg_score = summary['score'].mean()
 
     with col1:
         st.metric("Top Candidate", top_candidate['name'], f"{top_candidate['score']}/100")
@@ -973,7 +1507,7 @@ def show_dashboard():
 
 def show_candidate_details():
     """Show detailed analysis for a specific candidate"""
-    candidate_name = st.selectbox("Select Candidate", list(CANDIDATES.keys()))
+    candidate_name = st.selectbox("Select Candidate", CANDIDATE_NAMES, key="candidate_select")
 
     candidate = CANDIDATES[candidate_name]
     sub_scores, overall_score, explanation = get_candidate_scores(candidate_name)
@@ -996,32 +1530,7 @@ def show_candidate_details():
 
     with col1:
         # Gauge chart for overall score
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=overall_score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Growth Potential", 'font': {'size': 20}},
-            number={'font': {'size': 60}},
-            gauge={
-                'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-                'bar': {'color': "#667eea"},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "gray",
-                'steps': [
-                    {'range': [0, 60], 'color': '#fee2e2'},
-                    {'range': [60, 75], 'color': '#dbeafe'},
-                    {'range': [75, 100], 'color': '#d1fae5'}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 70
-                }
-            }
-        ))
-        fig_gauge.update_layout(height=400, margin=dict(l=10, r=10, t=50, b=10))
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.plotly_chart(_build_score_gauge(overall_score), use_container_width=True)
 
     with col2:
         st.markdown(explanation)
@@ -1037,9 +1546,9 @@ def show_candidate_details():
     with tab1:
         col1, col2 = st.columns(2)
         with col1:
-            st.plotly_chart(create_radar_chart(sub_scores, candidate_name), use_container_width=True)
+            st.plotly_chart(create_radar_chart(tuple(sub_scores.items()), candidate_name), use_container_width=True)
         with col2:
-            st.plotly_chart(create_factor_breakdown_chart(sub_scores), use_container_width=True)
+            st.plotly_chart(create_factor_breakdown_chart(tuple(sub_scores.items())), use_container_width=True)
 
     with tab2:
         # Career Trajectory Analysis
@@ -1092,21 +1601,21 @@ def show_candidate_details():
 
             promo_data = []
             for promo in trajectory['promotions']:
-                from_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo['from_level'], "Unknown")
-                to_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo['to_level'], "Unknown")
+                from_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo.from_level, "Unknown")
+                to_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo.to_level, "Unknown")
                 promo_data.append({
-                    'Year': f"{promo['from_year']} → {promo['to_year']}",
+                    'Year': f"{promo.from_year} → {promo.to_year}",
                     'Promotion': f"{from_label} → {to_label}",
-                    'Time (Years)': promo['years'],
-                    'From Role': promo['from_role'],
-                    'To Role': promo['to_role']
+                    'Time (Years)': promo.years,
+                    'From Role': promo.from_role,
+                    'To Role': promo.to_role
                 })
 
             promo_df = pd.DataFrame(promo_data)
             st.dataframe(promo_df, use_container_width=True, hide_index=True)
 
             # Average promotion time
-            avg_time = np.mean([p['years'] for p in trajectory['promotions']])
+            avg_time = np.mean([p.years for p in trajectory['promotions']])
             st.info(f"⏱️ **Average time between promotions:** {avg_time:.1f} years")
 
     with tab3:
@@ -1138,50 +1647,32 @@ def show_comparison():
     comp_tab1, comp_tab2 = st.tabs(["📊 Growth Potential Scores", "🚀 Career Trajectory"])
 
     with comp_tab1:
-        # Calculate all scores
-        comparison_data = []
-        for name in CANDIDATES.keys():
-            sub_scores, overall_score, _ = get_candidate_scores(name)
-            comparison_data.append({
-                'Candidate': name,
-                'Overall': overall_score,
-                **{k.replace('_', ' ').title(): v for k, v in sub_scores.items()}
-            })
-
-        df = pd.DataFrame(comparison_data)
+        # Slice the precomputed scores
+        factors = list(GrowthPotentialScorer.WEIGHTS)
+        df = candidates_df()[['name', 'score', *factors]].rename(columns={
+            'name': 'Candidate',
+            'score': 'Overall',
+            **{k: k.replace('_', ' ').title() for k in factors}
+        })
 
         # Heatmap
         st.subheader("Score Heatmap")
 
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=df.iloc[:, 1:].values.T,
-            x=df['Candidate'],
-            y=df.columns[1:],
-            colorscale='RdYlGn',
-            text=df.iloc[:, 1:].values.T,
-            texttemplate='%{text:.0f}',
-            textfont={"size": 14},
-            colorbar=dict(title="Score")
-        ))
-
-        fig_heatmap.update_layout(
-            height=500,
-            xaxis_title="Candidate",
-            yaxis_title="Factor"
-        )
-
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(create_score_heatmap(df), use_container_width=True)
 
         # Detailed comparison table
         st.subheader("Detailed Scores")
 
-        # Style the dataframe
-        def highlight_max(s):
-            is_max = s == s.max()
-            return ['background-color: #d1fae5' if v else '' for v in is_max]
-
-        styled_df = df.style.apply(highlight_max, subset=df.columns[1:])
-        st.dataframe(styled_df, use_container_width=True)
+        # Native score bars instead of a per-cell pandas Styler
+        st.dataframe(
+            df,
+            column_config={
+                col: st.column_config.ProgressColumn(col, format="%.1f", min_value=0, max_value=100)
+                for col in df.columns[1:]
+            },
+            use_container_width=True,
+            hide_index=True
+        )
 
         # Factor-by-factor comparison
         st.subheader("Factor-by-Factor Comparison")
@@ -1189,42 +1680,14 @@ def show_comparison():
         factor_cols = df.columns[2:]  # Skip 'Candidate' and 'Overall'
         selected_factor = st.selectbox("Select Factor to Compare", factor_cols)
 
-        fig_factor = go.Figure()
-
-        fig_factor.add_trace(go.Bar(
-            x=df['Candidate'],
-            y=df[selected_factor],
-            marker=dict(
-                color=df[selected_factor],
-                colorscale='Viridis',
-                showscale=True
-            ),
-            text=df[selected_factor],
-            texttemplate='%{text:.1f}',
-            textposition='outside'
-        ))
-
-        fig_factor.update_layout(
-            title=f"{selected_factor} Comparison",
-            xaxis_title="Candidate",
-            yaxis_title="Score",
-            yaxis=dict(range=[0, 110]),
-            height=400
-        )
-
-        st.plotly_chart(fig_factor, use_container_width=True)
+        st.plotly_chart(create_factor_comparison_chart(df, selected_factor), use_container_width=True)
 
     with comp_tab2:
         st.subheader("Career Trajectory Comparison")
 
         # Get trajectory data for all candidates
-        trajectory_data = {}
-        trajectory_metrics = {}
-
-        for name in CANDIDATES.keys():
-            metrics = CareerTrajectoryAnalyzer.get_trajectory_metrics(name)
-            trajectory_data[name] = metrics['progression']
-            trajectory_metrics[name] = metrics
+        trajectory_metrics = all_trajectory_metrics()
+        trajectory_data = {name: metrics['progression'] for name, metrics in trajectory_metrics.items()}
 
         # Trajectory comparison chart
         st.plotly_chart(create_trajectory_comparison_chart(trajectory_data), use_container_width=True)
@@ -1234,30 +1697,14 @@ def show_comparison():
         # Trajectory metrics comparison table
         st.subheader("Trajectory Metrics Comparison")
 
-        metrics_data = []
-        for name, metrics in trajectory_metrics.items():
-            current_level_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(metrics['current_level'], "Unknown")
-            avg_promo_time = np.mean([p['years'] for p in metrics['promotions']]) if metrics['promotions'] else 0
-
-            metrics_data.append({
-                'Candidate': name,
-                'Pattern': metrics['pattern'],
-                'Current Level': current_level_label,
-                'Levels Gained': metrics['levels_gained'],
-                'Velocity (levels/year)': metrics['velocity'],
-                'Avg Promotion Time (years)': f"{avg_promo_time:.1f}" if avg_promo_time > 0 else "N/A",
-                'Acceleration': metrics['acceleration'].title()
-            })
-
-        metrics_df = pd.DataFrame(metrics_data)
-        st.dataframe(metrics_df, use_container_width=True, hide_index=True)
+        st.dataframe(trajectory_metrics_df(), use_container_width=True, hide_index=True)
 
         st.markdown("---")
 
         # Individual candidate trajectories
         st.subheader("Individual Trajectory Details")
 
-        selected_candidate = st.selectbox("Select candidate to view detailed trajectory", list(CANDIDATES.keys()), key="traj_select")
+        selected_candidate = st.selectbox("Select candidate to view detailed trajectory", CANDIDATE_NAMES, key="traj_select")
 
         if selected_candidate:
             selected_metrics = trajectory_metrics[selected_candidate]
@@ -2,95 +2,226 @@
 Candidate data model and scoring logic for Growth Potential assessment
 """
 import numpy as np
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+from candidate_data_numba import (
+    NUMBA_AVAILABLE as _NUMBA_AVAILABLE, score_kernel as _score_kernel, sub_score_kernel as _sub_score_kernel
+)
+
+# Weights for each sub-factor (must sum to 100)
+WEIGHTS = {
+    'learning_agility': 30,
+    'skill_progression': 25,
+    'adaptability': 20,
+    'innovation_mindset': 15,
+    'feedback_integration': 10
+}
 
-class GrowthPotentialScorer:
-    """Calculates Growth Potential score based on multiple sub-factors"""
 
-    # Weights for each sub-factor (must sum to 100)
-    WEIGHTS = {
-        'learning_agility': 30,
-        'skill_progression': 25,
-        'adaptability': 20,
-        'innovation_mindset': 15,
-        'feedback_integration': 10
-    }
+class ScoringTerm(NamedTuple):
+    """One input metric's contribution to a factor: min(max(coeff * value + bias, floor), cap)"""
+    metric: str
+    coeff: float
+    bias: float = 0
+    floor: float = -np.inf
+    cap: float = np.inf
+
+
+class FactorFormula(NamedTuple):
+    """A sub-factor score: the sum of its terms, scaled by 100 / normalizer and capped at score_cap"""
+    terms: tuple
+    normalizer: float = 100
+    score_cap: float = np.inf
+
+
+# The single definition of every sub-factor formula (terms in calculate_* argument order).
+# Both the calculate_* functions and GrowthPotentialScorer's vectorized tables are built from it.
+FORMULAS = {
+    'learning_agility': FactorFormula((
+        ScoringTerm('certifications', 15, cap=40),
+        ScoringTerm('courses_completed', 5, cap=30),
+        ScoringTerm('learning_velocity', -3, bias=30, floor=0)
+    ), score_cap=100),
+    'skill_progression': FactorFormula((
+        ScoringTerm('role_transitions', 20, cap=40),
+        ScoringTerm('tech_stack_breadth', 4, cap=40),
+        # Lower seniority_growth is better (faster progression)
+        ScoringTerm('seniority_growth', -2, bias=30, floor=10)
+    ), normalizer=110),
+    'adaptability': FactorFormula((
+        ScoringTerm('industry_switches', 25, cap=50),
+        ScoringTerm('domain_pivots', 15, cap=30),
+        ScoringTerm('challenge_response', 2)
+    )),
+    'innovation_mindset': FactorFormula((
+        ScoringTerm('side_projects', 15, cap=45),
+        ScoringTerm('contributions', 8, cap=35),
+        ScoringTerm('patents_publications', 10, cap=20)
+    )),
+    'feedback_integration': FactorFormula((
+        ScoringTerm('performance_improvements', 15, cap=40),
+        ScoringTerm('mentorship_sought', 3),
+        ScoringTerm('self_awareness', 3)
+    ))
+}
 
-    @staticmethod
-    def calculate_learning_agility(certifications, courses_completed, learning_velocity):
-        """
-        Learning Agility: How quickly they acquire new skills
-        - certifications: number of certifications earned
-        - courses_completed: courses in last 12 months
-        - learning_velocity: months between skill acquisitions (lower is better)
-        """
-        cert_score = min(certifications * 15, 40)
-        course_score = min(courses_completed * 5, 30)
-        velocity_score = max(30 - learning_velocity * 3, 0)
-        return min((cert_score + course_score + velocity_score) / 100 * 100, 100)
 
-    @staticmethod
-    def calculate_skill_progression(role_transitions, tech_stack_breadth, seniority_growth):
-        """
-        Skill Progression: Career trajectory and skill development
-        - role_transitions: number of meaningful role changes
-        - tech_stack_breadth: number of technologies mastered
-        - seniority_growth: years to reach current level
-        """
-        transition_score = min(role_transitions * 20, 40)
-        breadth_score = min(tech_stack_breadth * 4, 40)
-        # Lower seniority_growth is better (faster progression)
-        growth_score = max(30 - seniority_growth * 2, 10)
-        return (transition_score + breadth_score + growth_score) / 110 * 100
+def score_factor(factor, *values):
+    """Score one sub-factor from its metric values (in FORMULAS term order)"""
+    formula = FORMULAS[factor]
+    total = 0
+    for term, value in zip(formula.terms, values):
+        total += min(max(term.coeff * value + term.bias, term.floor), term.cap)
+    return min(total / formula.normalizer * 100, formula.score_cap)
+
+
+def calculate_learning_agility(certifications, courses_completed, learning_velocity):
+    """
+    Learning Agility: How quickly they acquire new skills
+    - certifications: number of certifications earned
+    - courses_completed: courses in last 12 months
+    - learning_velocity: months between skill acquisitions (lower is better)
+    """
+    return score_factor('learning_agility', certifications, courses_completed, learning_velocity)
+
+
+def calculate_skill_progression(role_transitions, tech_stack_breadth, seniority_growth):
+    """
+    Skill Progression: Career trajectory and skill development
+    - role_transitions: number of meaningful role changes
+    - tech_stack_breadth: number of technologies mastered
+    - seniority_growth: years to reach current level
+    """
+    return score_factor('skill_progression', role_transitions, tech_stack_breadth, seniority_growth)
+
+
+def calculate_adaptability(industry_switches, domain_pivots, challenge_response):
+    """
+    Adaptability: Ability to thrive in changing environments
+    - industry_switches: times switched industries/domains
+    - domain_pivots: major technology/role pivots
+    - challenge_response: score from behavioral interviews (0-10)
+    """
+    return score_factor('adaptability', industry_switches, domain_pivots, challenge_response)
+
+
+def calculate_innovation_mindset(side_projects, contributions, patents_publications):
+    """
+    Innovation Mindset: Creative problem-solving and initiative
+    - side_projects: personal/open-source projects
+    - contributions: meaningful contributions to teams
+    - patents_publications: patents, papers, or technical blogs
+    """
+    return score_factor('innovation_mindset', side_projects, contributions, patents_publications)
+
+
+def calculate_feedback_integration(performance_improvements,
+                                   mentorship_sought,
+                                   self_awareness):
+    """
+    Feedback Integration: How well they learn from feedback
+    - performance_improvements: documented improvements after feedback
+    - mentorship_sought: actively seeks mentorship (0-10)
+    - self_awareness: demonstrated self-awareness (0-10)
+    """
+    return score_factor('feedback_integration', performance_improvements, mentorship_sought, self_awareness)
 
-    @staticmethod
-    def calculate_adaptability(industry_switches, domain_pivots, challenge_response):
-        """
-        Adaptability: Ability to thrive in changing environments
-        - industry_switches: times switched industries/domains
-        - domain_pivots: major technology/role pivots
-        - challenge_response: score from behavioral interviews (0-10)
-        """
-        switch_score = min(industry_switches * 25, 50)
-        pivot_score = min(domain_pivots * 15, 30)
-        response_score = challenge_response * 2
-        return (switch_score + pivot_score + response_score) / 100 * 100
 
-    @staticmethod
-    def calculate_innovation_mindset(side_projects, contributions, patents_publications):
+class GrowthPotentialScorer:
+    """Calculates Growth Potential score based on multiple sub-factors"""
+
+    # Weights for each sub-factor (the module-level WEIGHTS)
+    WEIGHTS = WEIGHTS
+    # Fixed factor ordering with the weights as an aligned array
+    FACTORS = tuple(WEIGHTS)
+    WEIGHTS_ARR = np.array(list(WEIGHTS.values()), dtype=np.float64)
+    # Weights as fractions (weight / 100), applied factor by factor in calculate_overall_matrix
+    WEIGHTS_VEC = WEIGHTS_ARR / 100.0
+
+    # Input metrics per factor, in calculate_* argument order (the metric matrix column schema)
+    METRICS = {factor: tuple(term.metric for term in FORMULAS[factor].terms) for factor in WEIGHTS}
+
+    # Vectorized form of FORMULAS. Each factor has three input metrics (in CANDIDATES
+    # metric order); every term is clip(coeff * x + bias, floor, cap), terms are summed
+    # per factor and scaled by 100 / normalizer. Rows follow WEIGHTS order.
+    COEFFS = np.array([[term.coeff for term in FORMULAS[factor].terms] for factor in WEIGHTS], dtype=np.float64)
+    BIAS = np.array([[term.bias for term in FORMULAS[factor].terms] for factor in WEIGHTS], dtype=np.float64)
+    TERM_FLOOR = np.array([[term.floor for term in FORMULAS[factor].terms] for factor in WEIGHTS], dtype=np.float64)
+    TERM_CAP = np.array([[term.cap for term in FORMULAS[factor].terms] for factor in WEIGHTS], dtype=np.float64)
+    NORMALIZER = np.array([FORMULAS[factor].normalizer for factor in WEIGHTS], dtype=np.float64)
+    SCORE_CAP = np.array([FORMULAS[factor].score_cap for factor in WEIGHTS], dtype=np.float64)
+
+    # The per-factor formulas are module-level functions; kept here for existing callers
+    calculate_learning_agility = staticmethod(calculate_learning_agility)
+    calculate_skill_progression = staticmethod(calculate_skill_progression)
+    calculate_adaptability = staticmethod(calculate_adaptability)
+    calculate_innovation_mindset = staticmethod(calculate_innovation_mindset)
+    calculate_feedback_integration = staticmethod(calculate_feedback_integration)
+
+    @classmethod
+    def calculate_all(cls, inputs):
         """
-        Innovation Mindset: Creative problem-solving and initiative
-        - side_projects: personal/open-source projects
-        - contributions: meaningful contributions to teams
-        - patents_publications: patents, papers, or technical blogs
+        Calculate all five sub-factor scores in one vectorized pass
+        - inputs: 15 metric values, three per factor in WEIGHTS order
         """
-        project_score = min(side_projects * 15, 45)
-        contribution_score = min(contributions * 8, 35)
-        ip_score = min(patents_publications * 10, 20)
-        return (project_score + contribution_score + ip_score) / 100 * 100
+        scores = cls.calculate_all_matrix(inputs)[0]
+        return {factor: float(score) for factor, score in zip(cls.WEIGHTS, scores)}
 
-    @staticmethod
-    def calculate_feedback_integration(performance_improvements,
-                                       mentorship_sought,
-                                       self_awareness):
+    @classmethod
+    def calculate_all_matrix(cls, metric_matrix):
         """
-        Feedback Integration: How well they learn from feedback
-        - performance_improvements: documented improvements after feedback
-        - mentorship_sought: actively seeks mentorship (0-10)
-        - self_awareness: demonstrated self-awareness (0-10)
+        Calculate sub-factor scores for many candidates in one vectorized pass
+        - metric_matrix: one row of 15 metric values per candidate (METRICS column schema)
+        Returns an (n_candidates, 5) array with columns in WEIGHTS order
         """
-        improvement_score = min(performance_improvements * 15, 40)
-        mentorship_score = mentorship_sought * 3
-        awareness_score = self_awareness * 3
-        return (improvement_score + mentorship_score + awareness_score) / 100 * 100
+        if _NUMBA_AVAILABLE:
+            x = np.ascontiguousarray(metric_matrix, dtype=np.float64).reshape(-1, cls.COEFFS.size)
+            return _sub_score_kernel(x, cls.COEFFS, cls.BIAS, cls.TERM_FLOOR, cls.TERM_CAP,
+                                     cls.NORMALIZER, cls.SCORE_CAP)
+
+        x = np.asarray(metric_matrix, dtype=np.float64).reshape(-1, *cls.COEFFS.shape)
+        terms = np.clip(cls.COEFFS * x + cls.BIAS, cls.TERM_FLOOR, cls.TERM_CAP)
+        return np.minimum(terms.sum(axis=2) / cls.NORMALIZER * 100, cls.SCORE_CAP)
 
     @classmethod
     def calculate_overall_score(cls, sub_scores):
         """Calculate weighted overall Growth Potential score"""
-        total = 0
-        for factor, weight in cls.WEIGHTS.items():
-            total += sub_scores[factor] * (weight / 100)
-        return round(total, 1)
+        return cls.overall_score_from_array(
+            np.array([sub_scores[factor] for factor in cls.FACTORS], dtype=np.float64)
+        )
+
+    @classmethod
+    def overall_score_from_array(cls, scores):
+        """Weighted overall score from a float64 array of sub-scores in WEIGHTS order"""
+        if _NUMBA_AVAILABLE:
+            total = _score_kernel(scores, cls.WEIGHTS_ARR)
+            return round(float(total), 1)
+
+        return cls.calculate_overall_matrix(scores.reshape(1, -1))[0]
+
+    @classmethod
+    def calculate_overall_matrix(cls, sub_score_matrix):
+        """
+        Weighted overall scores for many candidates in one vectorized pass
+        - sub_score_matrix: (n_candidates, 5) array with columns in WEIGHTS order
+        Returns a list of overall scores, rounded like calculate_overall_score
+        """
+        # Accumulate factor by factor (not a matrix product) so the summation
+        # order, and so the rounding, matches the single-candidate paths
+        totals = np.zeros(len(sub_score_matrix))
+        for weight, column in zip(cls.WEIGHTS_VEC, np.asarray(sub_score_matrix, dtype=np.float64).T):
+            totals += column * weight
+        return [round(float(total), 1) for total in totals]
+
+    # Explanation headline per overall score tier: SCORE_LABELS[bisect_right(SCORE_THRESHOLDS, score)]
+    SCORE_THRESHOLDS = (60, 75)
+    SCORE_LABELS = (
+        "**Developing Growth Potential** - This candidate has room to strengthen their growth trajectory.\n\n",
+        "**Strong Growth Potential** - This candidate shows solid potential for development and advancement.\n\n",
+        "**Exceptional Growth Potential** - This candidate demonstrates outstanding ability to learn, adapt, and evolve.\n\n"
+    )
 
     @classmethod
     def get_score_explanation(cls, sub_scores, overall_score):
@@ -105,27 +236,19 @@ class GrowthPotentialScorer:
             elif score < 60:
                 improvements.append(f"{factor_name} ({score:.0f}/100)")
 
-        explanation = f"**Overall Growth Potential: {overall_score}/100**\n\n"
-
-        if overall_score >= 75:
-            explanation += "**Exceptional Growth Potential** - This candidate demonstrates outstanding ability to learn, adapt, and evolve.\n\n"
-        elif overall_score >= 60:
-            explanation += "**Strong Growth Potential** - This candidate shows solid potential for development and advancement.\n\n"
-        else:
-            explanation += "**Developing Growth Potential** - This candidate has room to strengthen their growth trajectory.\n\n"
+        parts = [f"**Overall Growth Potential: {overall_score}/100**\n\n"]
+        parts.append(cls.SCORE_LABELS[bisect_right(cls.SCORE_THRESHOLDS, overall_score)])
 
         if strengths:
-            explanation += "**Key Strengths:**\n"
-            for s in strengths:
-                explanation += f"- {s}\n"
-            explanation += "\n"
+            parts.append("**Key Strengths:**\n")
+            parts.extend(f"- {s}\n" for s in strengths)
+            parts.append("\n")
 
         if improvements:
-            explanation += "**Areas for Development:**\n"
-            for i in improvements:
-                explanation += f"- {i}\n"
+            parts.append("**Areas for Development:**\n")
+            parts.extend(f"- {i}\n" for i in improvements)
 
-        return explanation
+        return "".join(parts)
 
 
 # Dummy candidate data
@@ -258,6 +381,52 @@ CANDIDATES = {
     }
 }
 
+# Keep every timeline in chronological order so consumers don't need to re-sort,
+# and keep its role changes (the input to seniority progression) alongside
+for _candidate in CANDIDATES.values():
+    _candidate['timeline'] = sorted(_candidate['timeline'], key=lambda x: x['year'])
+    _candidate['_role_changes'] = tuple(item for item in _candidate['timeline'] if item['type'] == 'role')
+
+# Read-only from here on: the memoized scores, trajectories and context strings assume it never changes
+CANDIDATES = MappingProxyType(CANDIDATES)
+# Candidate names in display order (e.g. for the app's selectboxes)
+CANDIDATE_NAMES = tuple(CANDIDATES)
+
+# Struct-of-arrays view of the metrics: one row per candidate (CANDIDATES order),
+# columns per GrowthPotentialScorer.METRICS, scored for every candidate at once
+_CANDIDATE_INDEX = {name: i for i, name in enumerate(CANDIDATES)}
+_METRIC_MATRIX = np.array([
+    [candidate['metrics'][factor][metric]
+     for factor, metrics in GrowthPotentialScorer.METRICS.items()
+     for metric in metrics]
+    for candidate in CANDIDATES.values()
+], dtype=np.float64)
+_SUB_SCORE_MATRIX = GrowthPotentialScorer.calculate_all_matrix(_METRIC_MATRIX)
+_OVERALL_SCORES = tuple(GrowthPotentialScorer.calculate_overall_matrix(_SUB_SCORE_MATRIX))
+
+
+class ProgressionStep(NamedTuple):
+    """One role change on a seniority progression (immutable, since memoized results share it)"""
+    year: int
+    level: int
+    event: str
+
+
+class Promotion(NamedTuple):
+    """A move up between two consecutive progression steps (immutable, since memoized results share it)"""
+    from_level: int
+    to_level: int
+    years: int
+    from_year: int
+    to_year: int
+    from_role: str
+    to_role: str
+
+
+def _mean(values):
+    """Mean of a short non-empty list (cheaper than np.mean on a handful of numbers)"""
+    return sum(values) / len(values)
+
 
 class CareerTrajectoryAnalyzer:
     """Analyzes career trajectory and seniority progression"""
@@ -271,40 +440,80 @@ class CareerTrajectoryAnalyzer:
         5: "Principal/Director"
     }
 
+    # Narrative text per velocity tier: VELOCITY_TEXT[bisect_right(VELOCITY_THRESHOLDS, velocity)]
+    VELOCITY_THRESHOLDS = (0.25, 0.4)
+    VELOCITY_TEXT = (
+        "With a trajectory velocity of **{velocity} levels/year**, this indicates **steady, measured growth** with focus on skill deepening.\n\n",
+        "With a trajectory velocity of **{velocity} levels/year**, this shows **solid career progression** at a healthy pace.\n\n",
+        "With a trajectory velocity of **{velocity} levels/year**, this represents **exceptional career acceleration** - significantly faster than industry averages.\n\n"
+    )
+
+    # Narrative text per average promotion time tier (upper bounds inclusive):
+    # PROMOTION_PACE_TEXT[bisect_left(PROMOTION_PACE_THRESHOLDS, avg_time)]
+    PROMOTION_PACE_THRESHOLDS = (2, 3, 5)
+    PROMOTION_PACE_TEXT = (
+        "⚡ This is exceptionally fast - well above market pace.\n",
+        "✨ This is faster than typical industry standards.\n",
+        "✓ This aligns with standard career progression timelines.\n",
+        "⏳ This suggests a focus on mastery before advancement.\n"
+    )
+
     @staticmethod
     def get_seniority_progression(timeline):
         """Extract seniority progression from timeline"""
-        # Get role changes only and sort by year
-        role_changes = [item for item in timeline if item['type'] == 'role']
-        role_changes.sort(key=lambda x: x['year'])
+        # Role changes only, in year order
+        return CareerTrajectoryAnalyzer.progression_from_role_changes(
+            sorted((item for item in timeline if item['type'] == 'role'), key=lambda x: x['year'])
+        )
+
+    @staticmethod
+    def progression_from_role_changes(role_changes):
+        """Seniority progression from role-change timeline items already in year order"""
+        return [
+            ProgressionStep(item['year'], item.get('seniority_level', 2), item['event'])
+            for item in role_changes
+        ]
 
+    @staticmethod
+    def progression_and_promotions(role_changes):
+        """
+        Seniority progression and promotions in a single pass over role-change
+        timeline items already in year order
+        Returns (progression, promotions)
+        """
         progression = []
+        promotions = []
+        prev = None
         for item in role_changes:
-            progression.append({
-                'year': item['year'],
-                'level': item.get('seniority_level', 2),
-                'event': item['event']
-            })
+            curr = ProgressionStep(item['year'], item.get('seniority_level', 2), item['event'])
+            if prev is not None and curr.level > prev.level:
+                promotions.append(CareerTrajectoryAnalyzer._promotion(prev, curr))
+            progression.append(curr)
+            prev = curr
+        return progression, promotions
 
-        return progression
+    @staticmethod
+    def _promotion(prev, curr):
+        """Promotion record for a move up from one progression step to the next"""
+        return Promotion(
+            from_level=prev.level,
+            to_level=curr.level,
+            years=curr.year - prev.year,
+            from_year=prev.year,
+            to_year=curr.year,
+            from_role=prev.event,
+            to_role=curr.event
+        )
 
     @staticmethod
     def calculate_time_between_promotions(progression):
         """Calculate time between each promotion"""
-        promotions = []
-        for i in range(len(progression) - 1):
-            if progression[i+1]['level'] > progression[i]['level']:
-                time_diff = progression[i+1]['year'] - progression[i]['year']
-                promotions.append({
-                    'from_level': progression[i]['level'],
-                    'to_level': progression[i+1]['level'],
-                    'years': time_diff,
-                    'from_year': progression[i]['year'],
-                    'to_year': progression[i+1]['year'],
-                    'from_role': progression[i]['event'],
-                    'to_role': progression[i+1]['event']
-                })
-        return promotions
+        # Consecutive (previous, current) pairs; zip over a slice since itertools.pairwise needs Python 3.10
+        return [
+            CareerTrajectoryAnalyzer._promotion(prev, curr)
+            for prev, curr in zip(progression, progression[1:])
+            if curr.level > prev.level
+        ]
 
     @staticmethod
     def calculate_trajectory_velocity(progression, experience_years):
@@ -312,24 +521,36 @@ class CareerTrajectoryAnalyzer:
         if not progression or experience_years == 0:
             return 0
 
-        start_level = progression[0]['level']
-        end_level = progression[-1]['level']
+        start_level = progression[0].level
+        end_level = progression[-1].level
         levels_gained = end_level - start_level
 
         velocity = levels_gained / experience_years
         return round(velocity, 2)
 
     @staticmethod
-    def calculate_trajectory_acceleration(progression):
-        """Calculate if trajectory is accelerating or decelerating"""
-        promotions = CareerTrajectoryAnalyzer.calculate_time_between_promotions(progression)
+    def calculate_trajectory_acceleration(progression, promotions=None):
+        """
+        Calculate if trajectory is accelerating or decelerating
+        - promotions: precomputed calculate_time_between_promotions(progression), if available
+        """
+        if promotions is None:
+            promotions = CareerTrajectoryAnalyzer.calculate_time_between_promotions(progression)
+
+        return CareerTrajectoryAnalyzer.acceleration_from_years(tuple(p.years for p in promotions))
 
-        if len(promotions) < 2:
+    @staticmethod
+    def acceleration_from_years(years):
+        """
+        Trajectory acceleration from the years each promotion took
+        - years: tuple of promotion durations, in promotion order
+        """
+        if len(years) < 2:
             return "stable"
 
         # Compare recent promotion speed to earlier ones
-        recent_avg = np.mean([p['years'] for p in promotions[-2:]])
-        earlier_avg = np.mean([p['years'] for p in promotions[:-2]]) if len(promotions) > 2 else recent_avg
+        recent_avg = _mean(years[-2:])
+        earlier_avg = _mean(years[:-2]) if len(years) > 2 else recent_avg
 
         if recent_avg < earlier_avg * 0.8:
             return "accelerating"
@@ -339,14 +560,23 @@ class CareerTrajectoryAnalyzer:
             return "stable"
 
     @staticmethod
-    def classify_trajectory_pattern(progression, experience_years, promotions):
-        """Classify trajectory into patterns"""
+    def classify_trajectory_pattern(progression, experience_years, promotions, velocity=None, acceleration=None,
+                                    promotion_years=None):
+        """
+        Classify trajectory into patterns
+        - velocity, acceleration, promotion_years: precomputed values, if available (computed here otherwise)
+        """
         if not progression or not promotions:
             return "Early Career"
 
-        velocity = CareerTrajectoryAnalyzer.calculate_trajectory_velocity(progression, experience_years)
-        avg_promotion_time = np.mean([p['years'] for p in promotions]) if promotions else float('inf')
-        total_levels = progression[-1]['level'] - progression[0]['level']
+        if velocity is None:
+            velocity = CareerTrajectoryAnalyzer.calculate_trajectory_velocity(progression, experience_years)
+        if promotion_years is None:
+            promotion_years = tuple(p.years for p in promotions)
+        if acceleration is None:
+            acceleration = CareerTrajectoryAnalyzer.acceleration_from_years(promotion_years)
+        avg_promotion_time = _mean(promotion_years) if promotions else float('inf')
+        total_levels = progression[-1].level - progression[0].level
 
         # Fast Riser: High velocity, quick promotions
         if velocity >= 0.4 and avg_promotion_time <= 2.5:
@@ -365,115 +595,128 @@ class CareerTrajectoryAnalyzer:
             return "Specialist 🎯"
 
         # Late Bloomer: Recent acceleration
-        elif CareerTrajectoryAnalyzer.calculate_trajectory_acceleration(progression) == "accelerating":
+        elif acceleration == "accelerating":
             return "Late Bloomer 🌟"
 
         # Plateaued: Slowing progression
-        elif CareerTrajectoryAnalyzer.calculate_trajectory_acceleration(progression) == "decelerating":
+        elif acceleration == "decelerating":
             return "Plateaued ⏸️"
 
         else:
             return "Developing 🌱"
 
     @staticmethod
-    def generate_trajectory_narrative(candidate_name, progression, promotions, pattern, velocity, experience_years):
-        """Generate natural language narrative about career trajectory"""
+    def generate_trajectory_narrative(candidate_name, progression, promotions, pattern, velocity, experience_years,
+                                      promotion_years=None):
+        """
+        Generate natural language narrative about career trajectory
+        - promotion_years: precomputed promotion durations, if available
+        """
         if not progression:
             return "Insufficient career history data."
 
-        start_level = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(progression[0]['level'], "Unknown")
-        current_level = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(progression[-1]['level'], "Unknown")
-        levels_gained = progression[-1]['level'] - progression[0]['level']
+        labels = CareerTrajectoryAnalyzer.SENIORITY_LABELS
+        start_level = labels.get(progression[0].level, "Unknown")
+        current_level = labels.get(progression[-1].level, "Unknown")
+        levels_gained = progression[-1].level - progression[0].level
 
-        narrative = f"**Career Trajectory: {pattern}**\n\n"
-        narrative += f"{candidate_name} started as a **{start_level}** professional and is currently at the **{current_level}** level, "
-        narrative += f"advancing **{levels_gained} level{'s' if levels_gained != 1 else ''}** over **{experience_years} years**.\n\n"
+        parts = [
+            f"**Career Trajectory: {pattern}**\n\n",
+            f"{candidate_name} started as a **{start_level}** professional and is currently at the **{current_level}** level, ",
+            f"advancing **{levels_gained} level{'s' if levels_gained != 1 else ''}** over **{experience_years} years**.\n\n"
+        ]
 
         # Velocity analysis
-        if velocity >= 0.4:
-            narrative += f"With a trajectory velocity of **{velocity} levels/year**, this represents **exceptional career acceleration** - significantly faster than industry averages.\n\n"
-        elif velocity >= 0.25:
-            narrative += f"With a trajectory velocity of **{velocity} levels/year**, this shows **solid career progression** at a healthy pace.\n\n"
-        else:
-            narrative += f"With a trajectory velocity of **{velocity} levels/year**, this indicates **steady, measured growth** with focus on skill deepening.\n\n"
+        velocity_text = CareerTrajectoryAnalyzer.VELOCITY_TEXT[bisect_right(CareerTrajectoryAnalyzer.VELOCITY_THRESHOLDS, velocity)]
+        parts.append(velocity_text.format(velocity=velocity))
 
         # Promotion details
         if promotions:
-            narrative += "**Promotion History:**\n"
+            parts.append("**Promotion History:**\n")
             for promo in promotions:
-                from_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo['from_level'], "Unknown")
-                to_label = CareerTrajectoryAnalyzer.SENIORITY_LABELS.get(promo['to_level'], "Unknown")
-                narrative += f"- **{promo['from_year']} → {promo['to_year']}** ({promo['years']} {'year' if promo['years'] == 1 else 'years'}): "
-                narrative += f"{from_label} to {to_label}\n"
+                from_label = labels.get(promo.from_level, "Unknown")
+                to_label = labels.get(promo.to_level, "Unknown")
+                parts.append(f"- **{promo.from_year} → {promo.to_year}** ({promo.years} {'year' if promo.years == 1 else 'years'}): ")
+                parts.append(f"{from_label} to {to_label}\n")
 
-            avg_time = np.mean([p['years'] for p in promotions])
-            narrative += f"\n**Average time between promotions:** {avg_time:.1f} years\n"
+            if promotion_years is None:
+                promotion_years = tuple(p.years for p in promotions)
+            avg_time = _mean(promotion_years)
+            parts.append(f"\n**Average time between promotions:** {avg_time:.1f} years\n")
 
-            if avg_time <= 2:
-                narrative += "⚡ This is exceptionally fast - well above market pace.\n"
-            elif avg_time <= 3:
-                narrative += "✨ This is faster than typical industry standards.\n"
-            elif avg_time <= 5:
-                narrative += "✓ This aligns with standard career progression timelines.\n"
-            else:
-                narrative += "⏳ This suggests a focus on mastery before advancement.\n"
+            parts.append(CareerTrajectoryAnalyzer.PROMOTION_PACE_TEXT[
+                bisect_left(CareerTrajectoryAnalyzer.PROMOTION_PACE_THRESHOLDS, avg_time)
+            ])
 
-        return narrative
+        return "".join(parts)
 
     @staticmethod
     def get_trajectory_metrics(candidate_name):
-        """Get all trajectory metrics for a candidate"""
+        """Get all trajectory metrics for a candidate (a fresh dict over the memoized metrics)"""
+        return dict(CareerTrajectoryAnalyzer._trajectory_metrics(candidate_name))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _trajectory_metrics(candidate_name):
+        """
+        Memoized trajectory metrics (CANDIDATES is static)
+        Progression and promotions are tuples so callers can't mutate the cached result
+        """
         candidate = CANDIDATES[candidate_name]
-        timeline = candidate['timeline']
         experience_years = candidate['experience_years']
 
-        progression = CareerTrajectoryAnalyzer.get_seniority_progression(timeline)
-        promotions = CareerTrajectoryAnalyzer.calculate_time_between_promotions(progression)
+        # Role changes were filtered and sorted once at import; walk them once for both
+        progression, promotions = CareerTrajectoryAnalyzer.progression_and_promotions(candidate['_role_changes'])
+        # Promotion durations are shared by the acceleration, pattern and narrative steps
+        promotion_years = tuple(p.years for p in promotions)
         velocity = CareerTrajectoryAnalyzer.calculate_trajectory_velocity(progression, experience_years)
-        acceleration = CareerTrajectoryAnalyzer.calculate_trajectory_acceleration(progression)
-        pattern = CareerTrajectoryAnalyzer.classify_trajectory_pattern(progression, experience_years, promotions)
+        acceleration = CareerTrajectoryAnalyzer.acceleration_from_years(promotion_years)
+        pattern = CareerTrajectoryAnalyzer.classify_trajectory_pattern(
+            progression, experience_years, promotions, velocity, acceleration, promotion_years
+        )
         narrative = CareerTrajectoryAnalyzer.generate_trajectory_narrative(
-            candidate_name, progression, promotions, pattern, velocity, experience_years
+            candidate_name, progression, promotions, pattern, velocity, experience_years, promotion_years
         )
 
         return {
-            'progression': progression,
-            'promotions': promotions,
+            'progression': tuple(progression),
+            'promotions': tuple(promotions),
             'velocity': velocity,
             'acceleration': acceleration,
             'pattern': pattern,
             'narrative': narrative,
-            'current_level': progression[-1]['level'] if progression else 0,
-            'levels_gained': progression[-1]['level'] - progression[0]['level'] if progression else 0
+            'current_level': progression[-1].level if progression else 0,
+            'levels_gained': progression[-1].level - progression[0].level if progression else 0
         }
 
 
-def get_candidate_scores(candidate_name):
-    """Calculate all scores for a candidate"""
-    candidate = CANDIDATES[candidate_name]
-    metrics = candidate['metrics']
+@lru_cache(maxsize=None)
+def get_candidate_scores(candidate_name, compute_explanation=True):
+    """
+    Calculate all scores for a candidate (memoized, CANDIDATES is static)
+    With compute_explanation=False the explanation text is skipped (returned as None)
+    The returned sub-scores mapping is read-only since it is shared between callers
+    """
+    # Sub-scores and overall scores for every candidate were computed in one pass at import
+    index = _CANDIDATE_INDEX[candidate_name]
+    sub_scores = {factor: float(score) for factor, score in zip(GrowthPotentialScorer.FACTORS, _SUB_SCORE_MATRIX[index])}
 
-    scorer = GrowthPotentialScorer()
+    overall_score = _OVERALL_SCORES[index]
+    explanation = GrowthPotentialScorer.get_score_explanation(sub_scores, overall_score) if compute_explanation else None
 
-    sub_scores = {
-        'learning_agility': scorer.calculate_learning_agility(**metrics['learning_agility']),
-        'skill_progression': scorer.calculate_skill_progression(**metrics['skill_progression']),
-        'adaptability': scorer.calculate_adaptability(**metrics['adaptability']),
-        'innovation_mindset': scorer.calculate_innovation_mindset(**metrics['innovation_mindset']),
-        'feedback_integration': scorer.calculate_feedback_integration(**metrics['feedback_integration'])
-    }
+    return MappingProxyType(sub_scores), overall_score, explanation
 
-    overall_score = scorer.calculate_overall_score(sub_scores)
-    explanation = scorer.get_score_explanation(sub_scores, overall_score)
 
-    return sub_scores, overall_score, explanation
+def get_candidate_overall_score(candidate_name):
+    """Overall score only, from the batch scored at import (no sub-score mapping or explanation)"""
+    return _OVERALL_SCORES[_CANDIDATE_INDEX[candidate_name]]
 
 
-def get_all_candidates_summary():
-    """Get summary scores for all candidates"""
+def build_candidates_summary():
+    """Build summary scores for all candidates, ranked by score"""
     summary = []
     for name in CANDIDATES.keys():
-        _, overall_score, _ = get_candidate_scores(name)
+        overall_score = get_candidate_overall_score(name)
         summary.append({
             'name': name,
             'role': CANDIDATES[name]['role'],
@@ -481,3 +724,58 @@ def get_all_candidates_summary():
             'photo': CANDIDATES[name]['photo']
         })
     return sorted(summary, key=lambda x: x['score'], reverse=True)
+
+
+def get_all_candidates_summary():
+    """Get summary scores for all candidates (copies of the precomputed rows)"""
+    return [dict(row) for row in CANDIDATE_SUMMARY]
+
+
+def build_candidate_context(candidate_name):
+    """Build comprehensive context about a candidate for the AI assistant"""
+    candidate = CANDIDATES[candidate_name]
+    sub_scores, overall_score, _ = get_candidate_scores(candidate_name, compute_explanation=False)
+
+    context = f"""
+CANDIDATE PROFILE: {candidate_name}
+Role: {candidate['role']}
+Experience: {candidate['experience_years']} years
+Background: {candidate['background']}
+
+GROWTH POTENTIAL SCORE: {overall_score}/100
+
+SUB-FACTOR SCORES:
+"""
+    for factor, score in sub_scores.items():
+        factor_name = factor.replace('_', ' ').title()
+        weight = GrowthPotentialScorer.WEIGHTS[factor]
+        context += f"- {factor_name}: {score:.1f}/100 (Weight: {weight}%)\n"
+
+    context += "\nDETAILED METRICS:\n"
+    for factor_key, metrics in candidate['metrics'].items():
+        factor_name = factor_key.replace('_', ' ').title()
+        context += f"\n{factor_name}:\n"
+        for metric, value in metrics.items():
+            context += f"  - {metric.replace('_', ' ').title()}: {value}\n"
+
+    context += "\nCAREER TIMELINE:\n"
+    for item in candidate['timeline']:
+        context += f"- {item['year']}: {item['event']} ({item['type']})\n"
+
+    return context
+
+
+def build_all_candidates_context():
+    """Build the AI assistant overview context covering every candidate"""
+    parts = ["OVERVIEW OF ALL CANDIDATES:\n\n"]
+    for name, candidate in CANDIDATES.items():
+        sub_scores, overall_score, _ = get_candidate_scores(name, compute_explanation=False)
+        parts.append(f"\n{name}:\n- Overall Score: {overall_score}/100\n- Role: {candidate['role']}\n")
+        parts.extend(f"- {factor.replace('_', ' ').title()}: {score:.1f}/100\n" for factor, score in sub_scores.items())
+    return "".join(parts)
+
+
+# The summary and AI assistant context strings depend only on the static CANDIDATES table, so build them once
+CANDIDATE_SUMMARY = tuple(build_candidates_summary())
+ALL_CANDIDATES_CONTEXT = build_all_candidates_context()
+PER_CANDIDATE_CONTEXT = {name: build_candidate_context(name) for name in CANDIDATES}
@@ -0,0 +1,53 @@
+"""
+Optional Numba-compiled kernels for Growth Potential scoring
+Falls back to the pure Python path in candidate_data when numba is not installed
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    score_kernel = None
+    sub_score_kernel = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def score_kernel(x, W):
+        """
+        Weighted Growth Potential aggregation
+        - x: sub-factor scores (float64, WEIGHTS order)
+        - W: factor weights in percent (float64, same order)
+        Returns the (unrounded) overall score
+        """
+        total = 0.0
+        for i in range(x.shape[0]):
+            total += x[i] * (W[i] / 100.0)
+        return total
+
+    @njit(cache=True)
+    def sub_score_kernel(X, coeffs, bias, floor, cap, normalizer, score_cap):
+        """
+        The five sub-factor formulas for a whole metric matrix, as scalar loops
+        - X: one row of metric values per candidate (float64, factor-major)
+        - coeffs, bias, floor, cap: per-term tables, one row per factor
+        - normalizer, score_cap: per-factor scaling and cap
+        Returns an (n_candidates, n_factors) array of sub-factor scores
+        """
+        n_factors, n_terms = coeffs.shape
+        out = np.empty((X.shape[0], n_factors))
+        for r in range(X.shape[0]):
+            for f in range(n_factors):
+                total = 0.0
+                for j in range(n_terms):
+                    term = coeffs[f, j] * X[r, f * n_terms + j] + bias[f, j]
+                    total += min(max(term, floor[f, j]), cap[f, j])
+                out[r, f] = min(total / normalizer[f] * 100, score_cap[f])
+        return out
+
+    # Compile at import so the first page render doesn't pay the JIT latency
+    score_kernel(np.zeros(5), np.ones(5))
+    sub_score_kernel(np.zeros((1, 15)), np.ones((5, 3)), np.zeros((5, 3)), np.zeros((5, 3)),
+                     np.ones((5, 3)), np.ones(5), np.ones(5))
@@ -30,11 +30,15 @@ def check_imports():
 def check_files():
     """Check if required files exist"""
     import os
-    required_files = ['app.py', 'candidate_data.py', 'requirements.txt']
+    required_files = ['app.py', 'candidate_data.py', 'style.css', 'requirements.txt']
     missing = []
     
+    # One directory listing instead of a stat() per file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"✅ {file} exists")
         else:
             print(f"❌ {file} is missing")